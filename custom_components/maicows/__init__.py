@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import zlib
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
@@ -11,6 +15,8 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
@@ -19,8 +25,13 @@ from .const import (
     CONF_CONNECTION_TYPE,
     CONF_SERIAL_PORT,
     CONF_SLAVE_ID,
+    CONNECT_TIMEOUT,
     CONNECTION_TYPE_RTU,
+    CONNECTION_TYPE_TCP,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    STABLE_POLLS_BEFORE_BACKOFF,
 )
 from .maico_ws_api import MaicoWS, MaicoWS320B
 
@@ -36,6 +47,47 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+@dataclass(slots=True, frozen=True)
+class MaicoConfig:
+    """Connection settings of a config entry."""
+
+    connection_type: str
+    slave_id: int
+    host: str | None
+    port: int
+    serial_port: str
+    baudrate: int
+
+    @classmethod
+    def from_entry_data(cls, data: Mapping[str, Any]) -> MaicoConfig:
+        """Build the settings from config entry data, applying defaults."""
+        return cls(
+            connection_type=data.get(CONF_CONNECTION_TYPE, CONNECTION_TYPE_TCP),
+            slave_id=data.get(CONF_SLAVE_ID, 1),
+            host=data.get(CONF_HOST),
+            port=data.get(CONF_PORT, 502),
+            serial_port=data.get(CONF_SERIAL_PORT, "/dev/ttyUSB0"),
+            baudrate=data.get(CONF_BAUDRATE, 9600),
+        )
+
+    @property
+    def description(self) -> str:
+        """Return a human readable connection string."""
+        if self.connection_type == CONNECTION_TYPE_RTU:
+            return f"serial {self.serial_port} ({self.baudrate} baud)"
+        return f"{self.host}:{self.port}"
+
+    def api_kwargs(self) -> dict[str, Any]:
+        """Return the MaicoWS constructor arguments for this connection."""
+        if self.connection_type == CONNECTION_TYPE_RTU:
+            return {
+                "serial_port": self.serial_port,
+                "baudrate": self.baudrate,
+                "slave_id": self.slave_id,
+            }
+        return {"host": self.host, "port": self.port, "slave_id": self.slave_id}
+
+
 class MaicoCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Maico WS data."""
 
@@ -45,25 +97,75 @@ class MaicoCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.api = api
         self.entry = entry
+        # Status dict reused across polls and updated in place
+        self._data_buf: dict[str, Any] = {}
+        # Consecutive polls without any register change
+        self._stable_count = 0
+        self._interval = DEFAULT_SCAN_INTERVAL
+        # Fixed slot within each DEFAULT_SCAN_INTERVAL window, so units sharing
+        # one gateway (same host, different slave ids) do not poll in lockstep
+        key = f"{api.host}/{api.slave_id}".encode()
+        self._poll_phase = zlib.crc32(key) / 2**32 * DEFAULT_SCAN_INTERVAL
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=self._phased_interval(hass.loop.time()),
+            # Listeners are only notified when the returned data differs
+            always_update=False,
         )
 
     async def _async_update_data(self) -> Any:
         """Fetch data from API endpoint."""
-        data = await self.api.read_all_registers()
+        self.api.clear_read_cache()
+        data = await self.api.read_all_registers_into(self._data_buf)
         if not data:
+            self._adapt_interval(changed=True)
             msg = "Error reading data from Maico WS device"
             raise UpdateFailed(msg)
-        return data
 
-    @property
+        self._adapt_interval(changed=self.api.status_changed)
+
+        # Hand back the current data when no register changed so no state
+        # update is fired; otherwise a snapshot that compares unequal to it
+        if self.data is not None and not self.api.status_changed:
+            return self.data
+        return dict(data)
+
+    def _adapt_interval(self, *, changed: bool) -> None:
+        """Back off polling while the device is idle, reset on activity."""
+        if changed:
+            self._stable_count = 0
+            self._interval = DEFAULT_SCAN_INTERVAL
+        else:
+            self._stable_count += 1
+            if self._stable_count >= STABLE_POLLS_BEFORE_BACKOFF:
+                self._stable_count = 0
+                self._interval = min(self._interval * 2, MAX_SCAN_INTERVAL)
+
+        self.update_interval = self._phased_interval(self.hass.loop.time())
+
+    def _phased_interval(self, now: float) -> timedelta:
+        """Return the delay closest to the interval that lands on our slot."""
+        # The coordinator schedules from the whole second of the loop clock;
+        # every interval is a multiple of DEFAULT_SCAN_INTERVAL, so snapping to
+        # the slot on each poll keeps the phase instead of letting it drift
+        slot_offset = (self._poll_phase - int(now) - self._interval) % (
+            DEFAULT_SCAN_INTERVAL
+        )
+        if slot_offset > DEFAULT_SCAN_INTERVAL / 2:
+            slot_offset -= DEFAULT_SCAN_INTERVAL
+        return timedelta(seconds=self._interval + slot_offset)
+
+    @cached_property
+    def unique_id_prefix(self) -> str:
+        """Return the prefix shared by the unique ids of the entry's entities."""
+        return f"{self.api.host}_{self.api.port}"
+
+    @cached_property
     def device_info(self) -> dict:
-        """Return device info."""
+        """Return device info, shared by all entities of the entry."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
             "name": f"Maico WS {self.entry.entry_id}",
@@ -74,34 +176,23 @@ class MaicoCoordinator(DataUpdateCoordinator):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Maico WS from a config entry."""
-    connection_type = entry.data.get(CONF_CONNECTION_TYPE, "tcp")
-    slave_id = entry.data.get(CONF_SLAVE_ID, 1)
-
-    if connection_type == CONNECTION_TYPE_RTU:
-        # RTU / Serial
-        serial_port = entry.data.get(CONF_SERIAL_PORT, "/dev/ttyUSB0")
-        baudrate = entry.data.get(CONF_BAUDRATE, 9600)
-        api = MaicoWS(serial_port=serial_port, baudrate=baudrate, slave_id=slave_id)
-        conn_str = f"serial {serial_port} ({baudrate} baud)"
-    else:
-        # TCP
-        host = entry.data.get(CONF_HOST)
-        port = entry.data.get(CONF_PORT, 502)
-        api = MaicoWS(host=host, port=port, slave_id=slave_id)
-        conn_str = f"{host}:{port}"
-        _LOGGER.info(
-            "Connecting to Maico WS at %s with slave_id=%d", conn_str, slave_id
-        )
+    config = MaicoConfig.from_entry_data(entry.data)
+
+    api = MaicoWS(**config.api_kwargs())
+    conn_str = config.description
+    _LOGGER.info(
+        "Connecting to Maico WS at %s with slave_id=%d", conn_str, config.slave_id
+    )
 
     try:
-        connected = await api.connect()
-    except Exception as e:
-        _LOGGER.exception("Failed to connect to Maico WS")
-        msg = f"Failed to connect to Maico WS: {e}"
-        raise ConfigEntryNotReady(msg) from e
+        connected = await asyncio.wait_for(api.connect(), timeout=CONNECT_TIMEOUT)
+    except TimeoutError as err:
+        await api.disconnect()
+        msg = f"Timeout connecting to Maico WS at {conn_str}"
+        raise ConfigEntryNotReady(msg) from err
 
     if not connected:
-        msg = f"Could not connect to Maico WS at {conn_str}"
+        msg = f"Could not connect to Maico WS at {conn_str}: {api.last_error}"
         raise ConfigEntryNotReady(msg)
 
     # Create the coordinator
@@ -110,8 +201,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_config_entry_first_refresh()
 
-    # Store the coordinator instance in hass.data
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Store the coordinator instance on the config entry
+    entry.runtime_data = coordinator
 
     # Forward the setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -122,10 +213,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Disconnect from the device
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: MaicoCoordinator = entry.runtime_data
     await coordinator.api.disconnect()
 
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -10,7 +10,6 @@ from homeassistant.const import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MaicoCoordinator
-from .const import DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -21,12 +20,12 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B button platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
     entities = [
         MaicoWS320BErrorResetButton(coordinator),
@@ -46,7 +45,7 @@ class MaicoWS320BErrorResetButton(CoordinatorEntity[MaicoCoordinator], ButtonEnt
         """Initialize the button."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_error_reset"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_error_reset"
         self._attr_device_info = coordinator.device_info
         self._attr_icon = "mdi:alert-remove"
 
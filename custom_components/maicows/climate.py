@@ -12,6 +12,7 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,7 +20,6 @@ from . import MaicoCoordinator
 from .const import (
     ATTR_EXTRACT_AIR_TEMP,
     ATTR_OUTDOOR_AIR_TEMP,
-    DOMAIN,
 )
 
 if TYPE_CHECKING:
@@ -37,28 +37,49 @@ SUPPORTED_HVAC_MODES = [HVACMode.OFF, HVACMode.FAN_ONLY]
 # 4=high (intensive)
 FAN_MODES = ["off", "auto", "low", "medium", "high"]
 
-# Internal mapping from VMC level to fan mode
-VENTILATION_TO_FAN_MODE = {
-    0: "off",
-    1: "auto",  # Humidity protection -> auto
-    2: "low",  # Reduced -> low
-    3: "medium",  # Normal -> medium
-    4: "high",  # Intensive -> high
-}
+# Internal mapping from VMC level to fan mode, indexed by level
+VENTILATION_TO_FAN_MODE = (
+    "off",
+    "auto",  # Humidity protection -> auto
+    "low",  # Reduced -> low
+    "medium",  # Normal -> medium
+    "high",  # Intensive -> high
+)
 
 # Reverse mapping from fan mode to VMC level
-FAN_MODE_TO_VENTILATION = {v: k for k, v in VENTILATION_TO_FAN_MODE.items()}
+FAN_MODE_TO_VENTILATION = {
+    mode: level for level, mode in enumerate(VENTILATION_TO_FAN_MODE)
+}
+
+# Coordinator keys exposed as extra state attributes: (data key, attribute)
+EXTRA_ATTRIBUTES = (
+    # Other temperature readings
+    ("extract_air_temperature", ATTR_EXTRACT_AIR_TEMP),
+    ("outdoor_air_temperature", ATTR_OUTDOOR_AIR_TEMP),
+    # Fan speeds
+    ("supply_fan_speed", "supply_fan_speed_rpm"),
+    ("extract_fan_speed", "extract_fan_speed_rpm"),
+    # Filter status
+    ("filter_status", "filter_status"),
+    # Operation mode
+    ("operation_mode", "operation_mode_raw"),
+    # Fault and info status
+    ("fault_status", "fault_status"),
+    ("info_messages", "info_messages"),
+    # Season
+    ("season", "season"),
+)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B climate platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
-    async_add_entities([MaicoWS320BClimate(coordinator)], update_before_add=True)
+    async_add_entities([MaicoWS320BClimate(coordinator)])
 
 
 class MaicoWS320BClimate(CoordinatorEntity[MaicoCoordinator], ClimateEntity):
@@ -71,7 +92,7 @@ class MaicoWS320BClimate(CoordinatorEntity[MaicoCoordinator], ClimateEntity):
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_climate"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_climate"
         self._attr_device_info = coordinator.device_info
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_supported_features = (
@@ -82,6 +103,31 @@ class MaicoWS320BClimate(CoordinatorEntity[MaicoCoordinator], ClimateEntity):
         self._attr_min_temp = 18  # Minimum temperature in Celsius (Maico limit)
         self._attr_max_temp = 25  # Maximum temperature in Celsius (Maico limit)
         self._attr_target_temperature_step = 0.5
+        self._attr_extra_state_attributes: dict[str, Any] = {}
+        self._update_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _update_extra_state_attributes(self) -> None:
+        """Refresh the cached extra state attributes in place."""
+        attributes = self._attr_extra_state_attributes
+        attributes.clear()
+
+        status = self.coordinator.data
+        if not status:
+            return
+
+        attributes.update(
+            {
+                attribute: value
+                for key, attribute in EXTRA_ATTRIBUTES
+                if (value := status.get(key)) is not None
+            }
+        )
 
     @property
     def current_temperature(self) -> float | None:
@@ -106,7 +152,11 @@ class MaicoWS320BClimate(CoordinatorEntity[MaicoCoordinator], ClimateEntity):
     def fan_mode(self) -> str | None:
         """Return the fan setting using standard HA modes."""
         ventilation_level = self.coordinator.data.get("current_ventilation_level")
-        return VENTILATION_TO_FAN_MODE.get(ventilation_level)
+        if ventilation_level is None or not (
+            0 <= ventilation_level < len(VENTILATION_TO_FAN_MODE)
+        ):
+            return None
+        return VENTILATION_TO_FAN_MODE[ventilation_level]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
@@ -174,44 +224,3 @@ class MaicoWS320BClimate(CoordinatorEntity[MaicoCoordinator], ClimateEntity):
             return HVACAction.OFF
         # For VMC, we'll return FAN as it's primarily a ventilation system
         return HVACAction.FAN
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        status = self.coordinator.data
-        if not status:
-            return {}
-
-        attributes = {}
-
-        # Add other temperature readings as attributes
-        if status.get("extract_air_temperature") is not None:
-            attributes[ATTR_EXTRACT_AIR_TEMP] = status["extract_air_temperature"]
-        if status.get("outdoor_air_temperature") is not None:
-            attributes[ATTR_OUTDOOR_AIR_TEMP] = status["outdoor_air_temperature"]
-
-        # Add fan speeds
-        if status.get("supply_fan_speed") is not None:
-            attributes["supply_fan_speed_rpm"] = status["supply_fan_speed"]
-        if status.get("extract_fan_speed") is not None:
-            attributes["extract_fan_speed_rpm"] = status["extract_fan_speed"]
-
-        # Add filter status
-        if status.get("filter_status") is not None:
-            attributes["filter_status"] = status["filter_status"]
-
-        # Add operation mode
-        if status.get("operation_mode") is not None:
-            attributes["operation_mode_raw"] = status["operation_mode"]
-
-        # Add fault and info status
-        if status.get("fault_status") is not None:
-            attributes["fault_status"] = status["fault_status"]
-        if status.get("info_messages") is not None:
-            attributes["info_messages"] = status["info_messages"]
-
-        # Add season
-        if status.get("season") is not None:
-            attributes["season"] = status["season"]
-
-        return attributes
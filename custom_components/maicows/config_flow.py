@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
@@ -16,11 +18,13 @@ from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 
+from . import MaicoConfig
 from .const import (
     CONF_BAUDRATE,
     CONF_CONNECTION_TYPE,
     CONF_SERIAL_PORT,
     CONF_SLAVE_ID,
+    CONNECT_TIMEOUT,
     CONNECTION_TYPE_RTU,
     CONNECTION_TYPE_TCP,
     DEFAULT_BAUDRATE,
@@ -34,10 +38,16 @@ from .maico_ws_api import MaicoWS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectable options, shared read-only by the schemas below
+CONNECTION_TYPE_CHOICES = MappingProxyType(
+    {CONNECTION_TYPE_TCP: "Modbus TCP", CONNECTION_TYPE_RTU: "Modbus RTU"}
+)
+BAUDRATES = (1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200)
+
 STEP_CONNECTION_TYPE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CONNECTION_TYPE, default=CONNECTION_TYPE_TCP): vol.In(
-            {CONNECTION_TYPE_TCP: "Modbus TCP", CONNECTION_TYPE_RTU: "Modbus RTU"}
+            CONNECTION_TYPE_CHOICES
         ),
     }
 )
@@ -54,9 +64,7 @@ STEP_TCP_DATA_SCHEMA = vol.Schema(
 STEP_RTU_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SERIAL_PORT, default=DEFAULT_SERIAL_PORT): str,
-        vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
-            [1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
-        ),
+        vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(BAUDRATES),
         vol.Required(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
     }
@@ -65,34 +73,22 @@ STEP_RTU_DATA_SCHEMA = vol.Schema(
 
 async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    connection_type = data.get(CONF_CONNECTION_TYPE)
-
     # Try to connect to the device
-    if connection_type == CONNECTION_TYPE_TCP:
-        host = data[CONF_HOST]
-        port = data[CONF_PORT]
-        slave_id = data[CONF_SLAVE_ID]
-        maico_api = MaicoWS(host=host, port=port, slave_id=slave_id)
-    else:  # RTU
-        serial_port = data[CONF_SERIAL_PORT]
-        baudrate = data[CONF_BAUDRATE]
-        slave_id = data[CONF_SLAVE_ID]
-        maico_api = MaicoWS(
-            serial_port=serial_port, baudrate=baudrate, slave_id=slave_id
-        )
+    maico_api = MaicoWS(**MaicoConfig.from_entry_data(data).api_kwargs())
 
     try:
-        connected = await maico_api.connect()
-        if connected:
-            await maico_api.disconnect()
-            return {"title": data[CONF_NAME]}
-        msg = "Could not connect to Maico WS"
-        raise CannotConnectError(msg)  # noqa: TRY301
-    except CannotConnectError:
-        raise
-    except Exception as e:
-        msg = f"Connection failed: {e}"
-        raise CannotConnectError(msg) from e
+        connected = await asyncio.wait_for(maico_api.connect(), timeout=CONNECT_TIMEOUT)
+    except TimeoutError as err:
+        await maico_api.disconnect()
+        msg = "Timeout connecting to Maico WS"
+        raise CannotConnectError(msg) from err
+
+    if not connected:
+        msg = f"Could not connect to Maico WS: {maico_api.last_error}"
+        raise CannotConnectError(msg)
+
+    await maico_api.disconnect()
+    return {"title": data[CONF_NAME]}
 
 
 class MaicoWSConfigFlow(ConfigFlow, domain=DOMAIN):
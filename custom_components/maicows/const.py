@@ -18,6 +18,9 @@ CONF_SERIAL_NUMBER: Final = "serial_number"
 CONNECTION_TYPE_TCP: Final = "tcp"
 CONNECTION_TYPE_RTU: Final = "rtu"
 
+# Upper bound (in seconds) for establishing the Modbus connection
+CONNECT_TIMEOUT: Final = 10
+
 # RTU defaults
 DEFAULT_BAUDRATE: Final = 9600
 DEFAULT_SERIAL_PORT: Final = "/dev/ttyUSB0"
@@ -37,6 +40,7 @@ PLATFORMS: Final[list[str]] = [
 ATTR_SUPPLY_AIR_TEMP: Final = "supply_air_temperature"
 ATTR_EXTRACT_AIR_TEMP: Final = "extract_air_temperature"
 ATTR_OUTDOOR_AIR_TEMP: Final = "outdoor_air_temperature"
+ATTR_TEMP_BEFORE_EWT: Final = "temperature_before_ewt"
 ATTR_SUPPLY_AIR_HUMIDITY: Final = (
     "extract_air_humidity"  # Maico uses extract for humidity
 )
@@ -119,4 +123,9 @@ FILTER_STATUS_REPLACE: Final = "replace"
 FILTER_STATUS_ALARM: Final = "alarm"
 
 # Default scan interval (in seconds)
-DEFAULT_SCAN_INTERVAL: Final = 30
+DEFAULT_SCAN_INTERVAL: Final = 10
+
+# Polling back-off: the interval doubles after this many unchanged polls,
+# up to MAX_SCAN_INTERVAL seconds, and drops back to the default on change
+STABLE_POLLS_BEFORE_BACKOFF: Final = 4
+MAX_SCAN_INTERVAL: Final = 120
@@ -4,20 +4,56 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from .const import DOMAIN
-
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
     from . import MaicoCoordinator
 
+# Coordinator data keys reported in the diagnostics current status
+DIAGNOSTICS_KEYS = (
+    # Temperatures
+    "supply_air_temperature",
+    "extract_air_temperature",
+    "room_temperature",
+    "inlet_air_temperature",
+    "temperature_before_ewt",
+    "exhaust_air_temperature",
+    # Humidity
+    "extract_air_humidity",
+    # Fan speeds
+    "supply_fan_speed",
+    "extract_fan_speed",
+    "supply_fan_state",
+    "extract_fan_state",
+    # Volume flows
+    "current_supply_volume_flow",
+    "current_extract_volume_flow",
+    # Operation
+    "operation_mode",
+    "current_ventilation_level",
+    "season",
+    "power_state",
+    "bypass_status",
+    # Temperatures settings
+    "target_temperature",
+    "supply_temp_min_cool",
+    "room_temp_max",
+    "room_temp_adjust",
+    # Filters
+    "filter_status",
+    # Errors
+    "fault_status",
+    "info_messages",
+)
+
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: ConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: MaicoCoordinator = entry.runtime_data
 
     # Get current data from coordinator
     data = coordinator.data or {}
@@ -34,42 +70,9 @@ async def async_get_config_entry_diagnostics(
             "slave_id": coordinator.api.slave_id,
             "connected": coordinator.api.connected,
         },
-        "current_status": {
-            # Temperatures
-            "supply_air_temperature": data.get("supply_air_temperature"),
-            "extract_air_temperature": data.get("extract_air_temperature"),
-            "room_temperature": data.get("room_temperature"),
-            "inlet_air_temperature": data.get("inlet_air_temperature"),
-            "exhaust_air_temperature": data.get("exhaust_air_temperature"),
-            # Humidity
-            "extract_air_humidity": data.get("extract_air_humidity"),
-            # Fan speeds
-            "supply_fan_speed": data.get("supply_fan_speed"),
-            "extract_fan_speed": data.get("extract_fan_speed"),
-            "supply_fan_state": data.get("supply_fan_state"),
-            "extract_fan_state": data.get("extract_fan_state"),
-            # Volume flows
-            "current_supply_volume_flow": data.get("current_supply_volume_flow"),
-            "current_extract_volume_flow": data.get("current_extract_volume_flow"),
-            # Operation
-            "operation_mode": data.get("operation_mode"),
-            "current_ventilation_level": data.get("current_ventilation_level"),
-            "season": data.get("season"),
-            "power_state": data.get("power_state"),
-            "bypass_status": data.get("bypass_status"),
-            # Temperatures settings
-            "target_temperature": data.get("target_temperature"),
-            "supply_temp_min_cool": data.get("supply_temp_min_cool"),
-            "room_temp_max": data.get("room_temp_max"),
-            "room_temp_adjust": data.get("room_temp_adjust"),
-            # Filters
-            "filter_status": data.get("filter_status"),
-            # Errors
-            "fault_status": data.get("fault_status"),
-            "info_messages": data.get("info_messages"),
-        },
+        "current_status": {key: data.get(key) for key in DIAGNOSTICS_KEYS},
         "coordinator_info": {
             "last_update_success": coordinator.last_update_success,
-            "update_interval": str(coordinator.update_interval),
+            "update_interval_seconds": coordinator.update_interval.total_seconds(),
         },
     }
@@ -6,13 +6,17 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MaicoCoordinator
-from .const import DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -21,35 +25,27 @@ _LOGGER = logging.getLogger(__name__)
 
 # Supported fan speeds for the Maico WS320B based on official documentation
 # 0=Off, 1=Humidity protection, 2=Reduced, 3=Nominal, 4=Intensive
-SPEED_LIST = ["off", "humidity_protection", "reduced", "normal", "intensive"]
+SPEED_LIST = ("off", "humidity_protection", "reduced", "normal", "intensive")
 
 # Mapping from HA speeds to fan levels
-SPEED_TO_LEVEL = {
-    "off": 0,
-    "humidity_protection": 1,
-    "reduced": 2,
-    "normal": 3,
-    "intensive": 4,
-}
-
-LEVEL_TO_SPEED = {
-    0: "off",
-    1: "humidity_protection",
-    2: "reduced",
-    3: "normal",
-    4: "intensive",
-}
+SPEED_TO_LEVEL = {speed: level for level, speed in enumerate(SPEED_LIST)}
+
+# Speed percentage of each fan level, indexed by level
+LEVEL_TO_PERCENTAGE = (0, 25, 50, 75, 100)
+
+# Level reported for out-of-range values (normal)
+DEFAULT_LEVEL = 3
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B fan platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
-    async_add_entities([MaicoWS320BFan(coordinator)], update_before_add=True)
+    async_add_entities([MaicoWS320BFan(coordinator)])
 
 
 class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
@@ -57,12 +53,14 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
 
     _attr_has_entity_name = True
     _attr_translation_key = "maico_fan"
+    # Preset modes based on official documentation, shared by all instances
+    _attr_preset_modes = SPEED_LIST
 
     def __init__(self, coordinator: MaicoCoordinator) -> None:
         """Initialize the fan entity."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_fan"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_fan"
         self._attr_device_info = coordinator.device_info
         self._attr_supported_features = (
             FanEntityFeature.SET_SPEED
@@ -71,46 +69,93 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
             | FanEntityFeature.TURN_OFF
         )
         self._attr_icon = "mdi:fan"
+        self._power_state: bool | None = None
+        self._ventilation_level: int | None = None
+        self._refresh_unsub: CALLBACK_TYPE | None = None
+        self._update_cached_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending delayed refresh."""
+        self._cancel_delayed_refresh()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
+    def _update_cached_state(self) -> None:
+        """Cache the coordinator values read by the state properties."""
+        data = self.coordinator.data or {}
+        self._power_state = data.get("power_state")
+        self._ventilation_level = data.get("current_ventilation_level")
+
+    async def _async_set_level(self, level: int) -> bool:
+        """Write a ventilation level and report it until the next refresh."""
+        if not await self._api.set_ventilation_level(level):
+            return False
 
-        # Define preset modes based on official documentation
-        self._attr_preset_modes = [
-            "off",
-            "humidity_protection",
-            "reduced",
-            "normal",
-            "intensive",
-        ]
+        # Show the new level right away and confirm it with a later refresh
+        # rather than an immediate sweep of every register
+        self._ventilation_level = level
+        if level:
+            # Callers switch the device on before setting a non-zero level
+            self._power_state = True
+        self.async_write_ha_state()
+        self._cancel_delayed_refresh()
+        self._refresh_unsub = async_call_later(
+            self.hass, DEFAULT_SCAN_INTERVAL, self._async_delayed_refresh
+        )
+        return True
+
+    async def _async_delayed_refresh(self, _now: datetime) -> None:
+        """Refresh the coordinator after an optimistic level update."""
+        self._refresh_unsub = None
+        # Bypass the request debouncer: a refresh requested by another entity
+        # shortly before would otherwise skip this one, and the values below
+        # would revert to data read before the write
+        await self.coordinator.async_refresh()
+        # Unchanged data notifies no listeners (always_update=False), so
+        # drop the optimistic values here rather than wait for a change
+        self._update_cached_state()
+        self.async_write_ha_state()
+
+    def _cancel_delayed_refresh(self) -> None:
+        """Cancel the delayed refresh if one is scheduled."""
+        if self._refresh_unsub is not None:
+            self._refresh_unsub()
+            self._refresh_unsub = None
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the entity is on."""
         # Check power state first
-        power_state = self.coordinator.data.get("power_state")
-        if power_state is not None and not power_state:
+        if self._power_state is not None and not self._power_state:
             return False
 
         # Also check ventilation level
-        ventilation_level = self.coordinator.data.get("current_ventilation_level")
-        return ventilation_level != 0
+        return self._ventilation_level != 0
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        ventilation_level = self.coordinator.data.get("current_ventilation_level")
+        ventilation_level = self._ventilation_level
         if ventilation_level is None:
             return None
-
-        # Map 0-4 to 0, 25, 50, 75, 100
-        return ventilation_level * 25
+        if not 0 <= ventilation_level < len(LEVEL_TO_PERCENTAGE):
+            ventilation_level = DEFAULT_LEVEL
+        return LEVEL_TO_PERCENTAGE[ventilation_level]
 
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode."""
-        ventilation_level = self.coordinator.data.get("current_ventilation_level")
+        ventilation_level = self._ventilation_level
         if ventilation_level is None:
             return None
-
-        return LEVEL_TO_SPEED.get(ventilation_level, "normal")
+        if not 0 <= ventilation_level < len(SPEED_LIST):
+            ventilation_level = DEFAULT_LEVEL
+        return SPEED_LIST[ventilation_level]
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode (fan level) based on official documentation."""
@@ -118,7 +163,7 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
             msg = f"Unsupported preset mode: {preset_mode}"
             raise HomeAssistantError(msg)
 
-        level = SPEED_TO_LEVEL.get(preset_mode, 3)  # Default to normal
+        level = SPEED_TO_LEVEL[preset_mode]
 
         # Ensure the device is turned on when setting a level
         if level != 0 and not self.is_on:  # Only turn on if not setting to "off"
@@ -128,21 +173,14 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
                 return
 
         # Set the fan level
-        level_success = await self._api.set_ventilation_level(level)
-
-        if level_success:
-            await self.coordinator.async_request_refresh()
-        else:
+        if not await self._async_set_level(level):
             _LOGGER.error("Failed to set preset mode to %s", preset_mode)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage."""
         if percentage == 0:
             # Turn off the fan (level 0)
-            success = await self._api.set_ventilation_level(0)
-            if success:
-                await self.coordinator.async_request_refresh()
-            else:
+            if not await self._async_set_level(0):
                 _LOGGER.error("Failed to turn off the fan")
         else:
             # Turn on the device if it's off
@@ -158,11 +196,7 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
             level = max(1, min(4, level))
 
             # Set the ventilation level
-            level_success = await self._api.set_ventilation_level(level)
-
-            if level_success:
-                await self.coordinator.async_request_refresh()
-            else:
+            if not await self._async_set_level(level):
                 _LOGGER.error("Failed to set fan speed to %d%%", percentage)
 
     async def async_turn_on(
@@ -183,16 +217,13 @@ class MaicoWS320BFan(CoordinatorEntity[MaicoCoordinator], FanEntity):
             await self.async_set_preset_mode(preset_mode)
         elif percentage is not None:
             await self.async_set_percentage(percentage)
+        # Default to reduced level (2) if no specific level requested
+        # and currently off
+        elif not self._ventilation_level:
+            if not await self._async_set_level(2):
+                _LOGGER.error("Failed to set the default fan level")
         else:
-            # Default to reduced level (2) if no specific level requested
-            # and currently off
-            current_level = self.coordinator.data.get("current_ventilation_level", 0)
-            if current_level == 0:
-                level_success = await self._api.set_ventilation_level(2)
-                if level_success:
-                    await self.coordinator.async_request_refresh()
-            else:
-                await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Turn off the fan."""
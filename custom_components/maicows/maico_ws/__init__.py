@@ -12,6 +12,8 @@ from .status import StatusMixin
 class MaicoWS(MaicoWSClient, SensorsMixin, ControlsMixin, StatusMixin):
     """Maico WS VMC API class combining all functionality."""
 
+    __slots__ = ()
+
 
 # Backward compatibility aliases
 MaicoWS320B = MaicoWS
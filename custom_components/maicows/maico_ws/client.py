@@ -2,19 +2,107 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import socket
+import time
+from typing import TYPE_CHECKING, Any
 
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
-from pymodbus.exceptions import ConnectionException, ModbusException
+from pymodbus.exceptions import ModbusException
 
-from .registers import MaicoWSRegisters
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Mapping, Sequence
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modbus PDU limit for a single FC03/FC04 request
+MAX_REGISTERS_PER_READ = 125
+
+# Modbus PDU limit for a single FC16 request
+MAX_REGISTERS_PER_WRITE = 123
+
+# Largest hole (in registers) read through when merging ad-hoc register reads
+MAX_REGISTER_GAP = 4
+
+# Seconds register values read during a refresh are served without a new read
+READ_CACHE_MAX_AGE = 2.0
+
+# Upper bound (seconds) of the pymodbus reconnect backoff after a dropped link
+RECONNECT_DELAY_MAX = 30
+
+
+def to_signed(value: int) -> int:
+    """Convert unsigned 16-bit to signed 16-bit."""
+    # Flip the sign bit, then shift back: maps 0x8000-0xFFFF onto -32768..-1
+    return (value ^ 0x8000) - 0x8000
+
+
+def to_unsigned(value: int) -> int:
+    """Convert signed 16-bit to unsigned 16-bit (two's complement)."""
+    return value & 0xFFFF
+
+
+def to_temp(raw: int) -> float:
+    """Convert raw register value to temperature (°C)."""
+    return to_signed(raw) / 10.0
+
+
+def from_temp(temp: float) -> int:
+    """Convert temperature (°C) to a raw register value in 0.1°C steps."""
+    return to_unsigned(round(temp * 10))
+
+
+def combine_words(hi: int, lo: int) -> int:
+    """Combine high and low words into a 32-bit value."""
+    return (hi << 16) | lo
+
+
+def merge_register_spans(
+    registers: Iterable[int],
+    max_gap: int = MAX_REGISTER_GAP,
+    max_count: int = MAX_REGISTERS_PER_READ,
+) -> list[tuple[int, int]]:
+    """Merge register addresses into (start, count) spans for block reads."""
+    spans: list[tuple[int, int]] = []
+    for register in sorted(set(registers)):
+        if spans:
+            start, count = spans[-1]
+            if register - (start + count) <= max_gap and register - start < max_count:
+                spans[-1] = (start, register - start + 1)
+                continue
+        spans.append((register, 1))
+    return spans
+
 
 class MaicoWSClient:
     """Base Modbus client for Maico WS VMC supporting TCP and RTU."""
 
+    __slots__ = (
+        "_baudrate",
+        "_changed_groups",
+        "_client",
+        "_connected",
+        "_failed_groups",
+        "_group_generations",
+        "_host",
+        "_is_rtu",
+        "_last_error",
+        "_link_down",
+        "_poll_count",
+        "_port",
+        "_read_cache",
+        "_read_cache_time",
+        "_serial_port",
+        "_slave_id",
+        "_status_blocks",
+        "_status_dest",
+        "_status_dest_generations",
+        "_status_poll",
+        "_written_registers",
+    )
+
     def __init__(
         self,
         host: str | None = None,
@@ -36,7 +124,25 @@ class MaicoWSClient:
         self._slave_id = slave_id
         self._client: AsyncModbusTcpClient | AsyncModbusSerialClient | None = None
         self._connected = False
+        self._last_error: str | None = None
+        # Set while pymodbus re-establishes a dropped link
+        self._link_down = False
         self._is_rtu = serial_port is not None
+        # Status polling state (see StatusMixin.get_all_status)
+        self._poll_count = 0
+        self._status_blocks: list[list[int] | None] = []
+        self._written_registers: set[int] = set()
+        # Bumped whenever a group's block changes; compared per destination
+        # dict by read_all_registers_into
+        self._group_generations: list[int] = []
+        self._status_dest: dict[str, Any] | None = None
+        self._status_dest_generations: list[int] = []
+        self._changed_groups: set[int] = set()
+        self._failed_groups: set[int] = set()
+        self._status_poll: asyncio.Future[list[list[int] | None] | None] | None = None
+        # Single register reads memoized for one coordinator refresh
+        self._read_cache: dict[int, int] = {}
+        self._read_cache_time = -math.inf
 
     @property
     def host(self) -> str | None:
@@ -58,8 +164,14 @@ class MaicoWSClient:
         """Return connection status."""
         return self._connected
 
+    @property
+    def last_error(self) -> str | None:
+        """Return why the last connection attempt failed, if it did."""
+        return self._last_error
+
     async def connect(self) -> bool:
         """Connect to the Maico WS device."""
+        self._last_error = None
         try:
             if self._is_rtu:
                 self._client = AsyncModbusSerialClient(
@@ -69,6 +181,7 @@ class MaicoWSClient:
                     parity="E",  # Even parity per Maico documentation
                     stopbits=1,
                     timeout=3,
+                    reconnect_delay_max=RECONNECT_DELAY_MAX,
                 )
                 _LOGGER.debug(
                     "Connecting to Maico WS via RTU: %s @ %d baud",
@@ -79,6 +192,8 @@ class MaicoWSClient:
                 self._client = AsyncModbusTcpClient(
                     host=self._host,
                     port=self._port,
+                    trace_connect=self._on_connection_change,
+                    reconnect_delay_max=RECONNECT_DELAY_MAX,
                 )
                 _LOGGER.debug(
                     "Connecting to Maico WS via TCP: %s:%d",
@@ -92,17 +207,59 @@ class MaicoWSClient:
                 _LOGGER.debug("Connected to Maico WS via %s", connection_type)
                 return True
 
-        except ConnectionException:
+        except ModbusException as err:
             _LOGGER.exception("Connection error to Maico WS")
+            self._last_error = str(err)
             return False
-        except Exception:
+        except OSError as err:
             _LOGGER.exception("Error connecting to Maico WS")
+            self._last_error = str(err)
             return False
 
         connection_type = "RTU" if self._is_rtu else "TCP"
         _LOGGER.error("Failed to connect to Maico WS via %s", connection_type)
+        self._last_error = f"no response via {connection_type}"
         return False
 
+    def _on_connection_change(self, connected: bool) -> None:  # noqa: FBT001
+        """Tune the TCP socket after each (re)connect."""
+        if connected:
+            self._tune_socket()
+
+    def _link_ready(self) -> bool:
+        """Return whether a request can be sent on the Modbus link now."""
+        if not self._connected:
+            _LOGGER.error("Not connected to Maico WS")
+            return False
+        if not self._client.connected:
+            # pymodbus keeps the client and reconnects with backoff on its
+            # own; a request now would only fail with a ConnectionException
+            if not self._link_down:
+                self._link_down = True
+                _LOGGER.warning("Lost connection to Maico WS, reconnecting")
+            return False
+        if self._link_down:
+            self._link_down = False
+            _LOGGER.warning("Connection to Maico WS restored")
+        return True
+
+    def _tune_socket(self) -> None:
+        """Send small Modbus frames without delay and detect dead peers."""
+        transport = getattr(getattr(self._client, "ctx", None), "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+
+        try:
+            # Disable Nagle so a request is not held back waiting for an ACK
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Let the kernel notice a gateway that silently went away
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            _LOGGER.debug("Could not tune Modbus socket options")
+        else:
+            _LOGGER.debug("TCP_NODELAY and SO_KEEPALIVE enabled on Modbus socket")
+
     async def disconnect(self) -> None:
         """Disconnect from the Maico WS device."""
         if self._client:
@@ -110,12 +267,36 @@ class MaicoWSClient:
             self._connected = False
             _LOGGER.debug("Disconnected from Maico WS")
 
+    def clear_read_cache(self) -> None:
+        """Forget single register values read during the current refresh."""
+        self._read_cache.clear()
+        self._read_cache_time = time.monotonic()
+
+    def cached_register(self, register: int, max_age: float) -> int | None:
+        """Return a register value from the current refresh if recent enough."""
+        if time.monotonic() - self._read_cache_time > max_age:
+            return None
+        return self._read_cache.get(register)
+
+    def _current_read_cache(self) -> dict[int, int]:
+        """Return the read cache, emptied first once older than its max age."""
+        now = time.monotonic()
+        if now - self._read_cache_time > READ_CACHE_MAX_AGE:
+            # Callers outside a coordinator refresh never clear the cache
+            self._read_cache.clear()
+            self._read_cache_time = now
+        return self._read_cache
+
     async def read_holding_register(self, register: int) -> int | None:
-        """Read a single holding register."""
-        if not self._connected:
-            _LOGGER.error("Not connected to Maico WS")
+        """Read a single holding register, cached for READ_CACHE_MAX_AGE."""
+        if not self._link_ready():
             return None
 
+        cache = self._current_read_cache()
+        cached = cache.get(register)
+        if cached is not None:
+            return cached
+
         try:
             response = await self._client.read_holding_registers(
                 address=register,
@@ -127,21 +308,19 @@ class MaicoWSClient:
                 _LOGGER.error("Error reading register %d: %s", register, response)
                 return None
 
-            return response.registers[0]
-
-        except ModbusException:
-            _LOGGER.exception("Modbus error reading register %d", register)
-            return None
-        except Exception:
-            _LOGGER.exception("Error reading register %d", register)
+        except (ModbusException, OSError) as err:
+            # Polled every few seconds: no traceback, formatted only when shown
+            _LOGGER.debug("Error reading register %d: %s", register, err)
             return None
+        else:
+            value = cache[register] = response.registers[0]
+            return value
 
     async def read_holding_registers(
         self, register: int, count: int
     ) -> list[int] | None:
         """Read multiple holding registers."""
-        if not self._connected:
-            _LOGGER.error("Not connected to Maico WS")
+        if not self._link_ready():
             return None
 
         try:
@@ -153,30 +332,53 @@ class MaicoWSClient:
 
             if response.isError():
                 _LOGGER.error(
-                    "Error reading registers %d-%d: %s",
-                    register,
-                    register + count - 1,
-                    response,
+                    "Error reading registers %d+%d: %s", register, count, response
                 )
                 return None
 
-            return list(response.registers)
-
-        except ModbusException:
-            _LOGGER.exception(
-                "Modbus error reading registers %d-%d", register, register + count - 1
-            )
-            return None
-        except Exception:
-            _LOGGER.exception(
-                "Error reading registers %d-%d", register, register + count - 1
-            )
+        except (ModbusException, OSError) as err:
+            _LOGGER.debug("Error reading registers %d+%d: %s", register, count, err)
             return None
+        else:
+            # pymodbus hands back a fresh list per response, no need to copy it
+            return response.registers
+
+    async def read_register_map(self, registers: Collection[int]) -> dict[int, int]:
+        """
+        Read several holding registers with as few block reads as possible.
+
+        Registers already read during the current refresh are not read again.
+        Returns the values keyed by register; registers of a failed block are
+        left out.
+        """
+        cache = self._current_read_cache()
+        values = {
+            register: cache[register] for register in registers if register in cache
+        }
+        spans = merge_register_spans(
+            register for register in registers if register not in values
+        )
+        for (start, count), block in zip(
+            spans, await self.read_blocks(spans), strict=True
+        ):
+            if block is not None:
+                values.update(zip(range(start, start + count), block, strict=False))
+        return values
+
+    async def read_blocks(
+        self, spans: Iterable[tuple[int, int]]
+    ) -> list[list[int] | None]:
+        """Read (start, count) register spans, concurrently when on TCP."""
+        reads = (self.read_holding_registers(start, count) for start, count in spans)
+        if self._is_rtu:
+            # Half-duplex bus: one request on the wire at a time
+            return [await read for read in reads]
+        # Each TCP request carries its own transaction id
+        return list(await asyncio.gather(*reads))
 
     async def write_register(self, register: int, value: int) -> bool:
         """Write a value to a single holding register."""
-        if not self._connected:
-            _LOGGER.error("Not connected to Maico WS")
+        if not self._link_ready():
             return False
 
         try:
@@ -193,28 +395,79 @@ class MaicoWSClient:
         except ModbusException:
             _LOGGER.exception("Modbus error writing register %d", register)
             return False
-        except Exception:
+        except OSError:
             _LOGGER.exception("Error writing register %d", register)
             return False
         else:
             _LOGGER.debug("Wrote value %d to register %d", value, register)
+            self._written_registers.add(register)
+            self._read_cache.pop(register, None)
             return True
 
-    # Helper methods for data conversion
-    @staticmethod
-    def to_signed(value: int) -> int:
-        """Convert unsigned 16-bit to signed 16-bit."""
-        if value > MaicoWSRegisters.MAX_INT_16BIT:
-            return value - 65536
-        return value
-
-    @staticmethod
-    def to_temp(raw: int) -> float:
-        """Convert raw register value to temperature (°C)."""
-        signed = MaicoWSClient.to_signed(raw)
-        return signed / 10.0
-
-    @staticmethod
-    def combine_words(hi: int, lo: int) -> int:
-        """Combine high and low words into a 32-bit value."""
-        return (hi << 16) | lo
+    async def write_registers(self, register: int, values: Sequence[int]) -> bool:
+        """Write values to consecutive holding registers in one request."""
+        if not self._link_ready():
+            return False
+
+        if self._is_rtu:
+            # The device only accepts FC06 single register writes over RTU
+            return await self._write_registers_singly(register, values)
+
+        count = len(values)
+        try:
+            response = await self._client.write_registers(
+                address=register,
+                values=list(values),
+                device_id=self._slave_id,
+            )
+
+            if response.isError():
+                _LOGGER.error(
+                    "Error writing registers %d+%d: %s", register, count, response
+                )
+                return False
+
+        except ModbusException:
+            _LOGGER.exception("Modbus error writing registers %d+%d", register, count)
+            return False
+        except OSError:
+            _LOGGER.exception("Error writing registers %d+%d", register, count)
+            return False
+        else:
+            _LOGGER.debug("Wrote values %s to registers %d+%d", values, register, count)
+            for written in range(register, register + count):
+                self._written_registers.add(written)
+                self._read_cache.pop(written, None)
+            return True
+
+    async def write_register_map(self, values: Mapping[int, int]) -> bool:
+        """
+        Write several holding registers with as few requests as possible.
+
+        Runs of consecutive registers go out as one write_registers request;
+        registers between two runs are never written. Stops at the first
+        failed request.
+        """
+        spans = merge_register_spans(
+            values, max_gap=0, max_count=MAX_REGISTERS_PER_WRITE
+        )
+        for start, count in spans:
+            run = [values[register] for register in range(start, start + count)]
+            if not await self.write_registers(start, run):
+                return False
+        return True
+
+    async def _write_registers_singly(
+        self, register: int, values: Sequence[int]
+    ) -> bool:
+        """Write consecutive holding registers with one request each."""
+        write = self.write_register
+        for offset, value in enumerate(values):
+            if not await write(register + offset, value):
+                return False
+        return True
+
+    # Helper methods for data conversion (kept for backward compatibility)
+    to_signed = staticmethod(to_signed)
+    to_temp = staticmethod(to_temp)
+    combine_words = staticmethod(combine_words)
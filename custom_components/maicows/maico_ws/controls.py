@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
 
+from .client import from_temp
 from .registers import MaicoWSRegisters
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+    from datetime import datetime
+
 _LOGGER = logging.getLogger(__name__)
 
 # Control constants
@@ -22,36 +29,94 @@ FILTER_OUTDOOR_MAX = 18
 FILTER_ROOM_MIN = 1
 FILTER_ROOM_MAX = 6
 
+# Age (seconds) up to which polled values are trusted to skip no-op writes;
+# short enough to only cover the refresh that just ran
+NOOP_WRITE_MAX_AGE = 2.0
+
+# Accepted raw values per setter, checked by membership
+OPERATION_MODES = range(OPERATION_MODE_MAX + 1)
+VENTILATION_LEVELS = range(
+    MaicoWSRegisters.VENTILATION_LEVEL_MIN, MaicoWSRegisters.VENTILATION_LEVEL_MAX + 1
+)
+SEASONS = frozenset((0, 1))
+ROOM_TEMP_SELECTIONS = range(ROOM_TEMP_SEL_MAX + 1)
+HUMIDITY_VALUES = range(HUMIDITY_MAX + 1)
+AIR_QUALITY_VALUES = range(AIR_QUALITY_MAX + 1)
+FILTER_DEVICE_MONTHS = range(FILTER_DEVICE_MIN, FILTER_DEVICE_MAX + 1)
+FILTER_OUTDOOR_MONTHS = range(FILTER_OUTDOOR_MIN, FILTER_OUTDOOR_MAX + 1)
+FILTER_ROOM_MONTHS = range(FILTER_ROOM_MIN, FILTER_ROOM_MAX + 1)
+
+# Registers cleared by writing 1, by reset kind
+ResetKind = Literal["device", "outdoor", "room", "error"]
+RESET_REGISTERS: MappingProxyType[str, int] = MappingProxyType(
+    {
+        "device": MaicoWSRegisters.FILTER_CHANGE_DEVICE,
+        "outdoor": MaicoWSRegisters.FILTER_CHANGE_OUTDOOR,
+        "room": MaicoWSRegisters.FILTER_CHANGE_ROOM,
+        "error": MaicoWSRegisters.ERROR_RESET,
+    }
+)
+
 
 class ControlsMixin:
     """Mixin providing control/write methods for MaicoWS."""
 
+    __slots__ = ()
+
     # These will be provided by the base class
     _connected: bool
     _slave_id: int
 
     # Note: write_register is inherited from MaicoWSClient base class
 
-    async def set_operation_mode(self, mode: int) -> bool:
-        """Set operation mode (0-5)."""
-        if mode < 0 or mode > OPERATION_MODE_MAX:
-            _LOGGER.error("Invalid operation mode: %d. Must be 0-5.", mode)
+    if TYPE_CHECKING:
+        # Resolved through the MRO at run time, declared here for type checkers
+        async def write_registers(self, register: int, values: Sequence[int]) -> bool:
+            """Write consecutive holding registers (from base class)."""
+
+        def cached_register(self, register: int, max_age: float) -> int | None:
+            """Return a recently polled register value (from base class)."""
+
+    async def _write_checked(
+        self, register: int, value: int, valid: Collection[int], name: str
+    ) -> bool:
+        """Write a value to a register if it is one of the accepted values."""
+        if value not in valid:
+            _LOGGER.error(
+                "Invalid %s: %d. Must be %d-%d.", name, value, min(valid), max(valid)
+            )
             return False
 
-        _LOGGER.debug("Setting operation mode to: %d", mode)
-        return await self.write_register(MaicoWSRegisters.OPERATION_MODE, mode)
+        _LOGGER.debug("Setting %s to: %d", name, value)
+        return await self.write_register(register, value)
 
-    async def set_ventilation_level(self, level: int) -> bool:
-        """Set ventilation level (0-4)."""
+    async def _write_setting(
+        self, register: int, value: int, valid: Collection[int], name: str
+    ) -> bool:
+        """Write a stored setting unless the device just reported that value."""
         if (
-            level < MaicoWSRegisters.VENTILATION_LEVEL_MIN
-            or level > MaicoWSRegisters.VENTILATION_LEVEL_MAX
+            value in valid
+            and self.cached_register(register, NOOP_WRITE_MAX_AGE) == value
         ):
-            _LOGGER.error("Invalid ventilation level: %d. Must be 0-4.", level)
-            return False
+            # Restoring a state the device already has, e.g. after a restart
+            _LOGGER.debug("%s already %d, not writing", name, value)
+            return True
+        return await self._write_checked(register, value, valid, name)
 
-        _LOGGER.debug("Setting ventilation level to: %d", level)
-        return await self.write_register(MaicoWSRegisters.VENTILATION_LEVEL, level)
+    async def set_operation_mode(self, mode: int) -> bool:
+        """Set operation mode (0-5)."""
+        return await self._write_checked(
+            MaicoWSRegisters.OPERATION_MODE, mode, OPERATION_MODES, "operation mode"
+        )
+
+    async def set_ventilation_level(self, level: int) -> bool:
+        """Set ventilation level (0-4)."""
+        return await self._write_checked(
+            MaicoWSRegisters.VENTILATION_LEVEL,
+            level,
+            VENTILATION_LEVELS,
+            "ventilation level",
+        )
 
     async def set_target_room_temperature(self, temp: float) -> bool:
         """Set target room temperature (18.0-25.0°C)."""
@@ -65,7 +130,7 @@ class ControlsMixin:
             return False
 
         # Convert to raw value (°C * 10), round to 0.5°C steps
-        raw_value = int(round(temp * 2) / 2 * 10)
+        raw_value = 5 * round(temp * 2)
         _LOGGER.debug("Setting target room temperature to: %.1f°C", temp)
         return await self.write_register(MaicoWSRegisters.TARGET_ROOM_TEMP, raw_value)
 
@@ -81,19 +146,15 @@ class ControlsMixin:
     async def write_room_temp_max(self, temp: float) -> bool:
         """Write maximum room temperature (register 302)."""
         # Register 302 stores values in 0.1°C increments
-        raw_value = int(temp * 10)
+        raw_value = from_temp(temp)
         _LOGGER.debug("Writing room temp max: %.1f°C", temp)
         return await self.write_register(MaicoWSRegisters.ROOM_TEMP_MAX, raw_value)
 
     async def set_season(self, season: int) -> bool:
         """Set season (0=Winter, 1=Summer)."""
-        if season not in [0, 1]:
-            _LOGGER.error("Invalid season: %d. Must be 0 or 1.", season)
-            return False
-
-        season_name = "Summer" if season == 1 else "Winter"
-        _LOGGER.debug("Setting season to: %s", season_name)
-        return await self.write_register(MaicoWSRegisters.SEASON, season)
+        return await self._write_setting(
+            MaicoWSRegisters.SEASON, season, SEASONS, "season"
+        )
 
     async def set_boost_ventilation(self, *, active: bool) -> bool:
         """Set boost ventilation (True=active, False=inactive)."""
@@ -101,90 +162,105 @@ class ControlsMixin:
         _LOGGER.debug("Setting boost to: %s", "active" if active else "inactive")
         return await self.write_register(MaicoWSRegisters.BOOST_VENTILATION, value)
 
+    async def reset(self, kind: ResetKind) -> bool:
+        """Reset a filter change indicator or the error status."""
+        _LOGGER.debug("Resetting %s", kind)
+        return await self.write_register(RESET_REGISTERS[kind], 1)
+
     async def reset_filter_device(self) -> bool:
         """Reset device filter change indicator."""
-        _LOGGER.debug("Resetting device filter indicator")
-        return await self.write_register(MaicoWSRegisters.FILTER_CHANGE_DEVICE, 1)
+        return await self.reset("device")
 
     async def reset_filter_outdoor(self) -> bool:
         """Reset outdoor filter change indicator."""
-        _LOGGER.debug("Resetting outdoor filter indicator")
-        return await self.write_register(MaicoWSRegisters.FILTER_CHANGE_OUTDOOR, 1)
+        return await self.reset("outdoor")
 
     async def reset_filter_room(self) -> bool:
         """Reset room filter change indicator."""
-        _LOGGER.debug("Resetting room filter indicator")
-        return await self.write_register(MaicoWSRegisters.FILTER_CHANGE_ROOM, 1)
+        return await self.reset("room")
+
+    async def reset_all_filters(self) -> bool:
+        """Reset the device, outdoor and room filter change indicators at once."""
+        _LOGGER.debug("Resetting all filter indicators")
+        return await self.write_registers(
+            MaicoWSRegisters.FILTER_CHANGE_DEVICE, (1, 1, 1)
+        )
+
+    async def set_datetime(self, value: datetime) -> bool:
+        """Set the device date and time."""
+        _LOGGER.debug("Setting date and time to: %s", value)
+        return await self.write_registers(
+            MaicoWSRegisters.DATE_YEAR,
+            (
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+            ),
+        )
 
     async def reset_error(self) -> bool:
         """Reset error status."""
-        _LOGGER.debug("Resetting error status")
-        return await self.write_register(MaicoWSRegisters.ERROR_RESET, 1)
+        return await self.reset("error")
 
     async def set_room_temp_selection(self, selection: int) -> bool:
         """Set room temp sensor selection (0-3)."""
-        if selection < 0 or selection > ROOM_TEMP_SEL_MAX:
-            _LOGGER.error("Invalid room temp selection: %d. Must be 0-3.", selection)
-            return False
-
-        _LOGGER.debug("Setting room temp selection to: %d", selection)
-        return await self.write_register(
-            MaicoWSRegisters.ROOM_TEMP_SELECTION, selection
+        return await self._write_checked(
+            MaicoWSRegisters.ROOM_TEMP_SELECTION,
+            selection,
+            ROOM_TEMP_SELECTIONS,
+            "room temp selection",
         )
 
     async def write_external_room_temp(self, temp: float) -> bool:
         """Write external room temperature value."""
-        raw_value = int(temp * 10)
+        raw_value = from_temp(temp)
         _LOGGER.debug("Writing external room temp: %.1f°C", temp)
         return await self.write_register(MaicoWSRegisters.ROOM_TEMP_EXT, raw_value)
 
     async def write_bus_room_temp(self, temp: float) -> bool:
         """Write bus room temperature (min cycle 10min)."""
-        raw_value = int(temp * 10)
+        raw_value = from_temp(temp)
         _LOGGER.debug("Writing bus room temp: %.1f°C", temp)
         return await self.write_register(MaicoWSRegisters.ROOM_TEMP_BUS, raw_value)
 
     async def write_bus_humidity(self, humidity: int) -> bool:
         """Write bus humidity value (0-100% RH, min cycle 10min)."""
-        if humidity < 0 or humidity > HUMIDITY_MAX:
-            _LOGGER.error("Invalid humidity: %d. Must be 0-100%%.", humidity)
-            return False
-
-        _LOGGER.debug("Writing bus humidity: %d%%", humidity)
-        return await self.write_register(MaicoWSRegisters.HUMIDITY_BUS, humidity)
+        return await self._write_checked(
+            MaicoWSRegisters.HUMIDITY_BUS, humidity, HUMIDITY_VALUES, "bus humidity"
+        )
 
     async def write_bus_air_quality(self, ppm: int) -> bool:
         """Write bus air quality/CO2 (0-5000 ppm, min cycle 10min)."""
-        if ppm < 0 or ppm > AIR_QUALITY_MAX:
-            _LOGGER.error("Invalid air quality: %d. Must be 0-5000 ppm.", ppm)
-            return False
-
-        _LOGGER.debug("Writing bus air quality: %d ppm", ppm)
-        return await self.write_register(MaicoWSRegisters.AIR_QUALITY_BUS, ppm)
+        return await self._write_checked(
+            MaicoWSRegisters.AIR_QUALITY_BUS, ppm, AIR_QUALITY_VALUES, "bus air quality"
+        )
 
     async def set_filter_device_months(self, months: int) -> bool:
         """Set device filter lifespan (3-12 months)."""
-        if months < FILTER_DEVICE_MIN or months > FILTER_DEVICE_MAX:
-            _LOGGER.error("Invalid filter lifespan: %d. Must be 3-12.", months)
-            return False
-
-        _LOGGER.debug("Setting device filter lifespan to: %d months", months)
-        return await self.write_register(MaicoWSRegisters.FILTER_DEVICE_MONTHS, months)
+        return await self._write_setting(
+            MaicoWSRegisters.FILTER_DEVICE_MONTHS,
+            months,
+            FILTER_DEVICE_MONTHS,
+            "device filter lifespan",
+        )
 
     async def set_filter_outdoor_months(self, months: int) -> bool:
         """Set outdoor filter lifespan (3-18 months)."""
-        if months < FILTER_OUTDOOR_MIN or months > FILTER_OUTDOOR_MAX:
-            _LOGGER.error("Invalid filter lifespan: %d. Must be 3-18.", months)
-            return False
-
-        _LOGGER.debug("Setting outdoor filter lifespan to: %d months", months)
-        return await self.write_register(MaicoWSRegisters.FILTER_OUTDOOR_MONTHS, months)
+        return await self._write_setting(
+            MaicoWSRegisters.FILTER_OUTDOOR_MONTHS,
+            months,
+            FILTER_OUTDOOR_MONTHS,
+            "outdoor filter lifespan",
+        )
 
     async def set_filter_room_months(self, months: int) -> bool:
         """Set room filter lifespan (1-6 months)."""
-        if months < FILTER_ROOM_MIN or months > FILTER_ROOM_MAX:
-            _LOGGER.error("Invalid filter lifespan: %d. Must be 1-6.", months)
-            return False
-
-        _LOGGER.debug("Setting room filter lifespan to: %d months", months)
-        return await self.write_register(MaicoWSRegisters.FILTER_ROOM_MONTHS, months)
+        return await self._write_setting(
+            MaicoWSRegisters.FILTER_ROOM_MONTHS,
+            months,
+            FILTER_ROOM_MONTHS,
+            "room filter lifespan",
+        )
@@ -3,36 +3,40 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
+from .client import combine_words, to_temp
 from .registers import MaicoWSRegisters
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class SensorsMixin:
     """Mixin providing sensor reading methods for MaicoWS."""
 
+    __slots__ = ()
+
     # These will be provided by the base class
     _connected: bool
     _slave_id: int
 
-    async def read_holding_register(self, register: int) -> int | None:
-        """Read a single holding register (from base class)."""
+    if TYPE_CHECKING:
+        # Resolved through the MRO at run time, declared here for type checkers
+        async def read_holding_register(self, register: int) -> int | None:
+            """Read a single holding register (from base class)."""
 
-    @staticmethod
-    def to_temp(raw: int) -> float:
-        """Convert raw to temperature (from base class)."""
-
-    @staticmethod
-    def to_signed(value: int) -> int:
-        """Convert to signed (from base class)."""
+        async def read_register_map(self, registers: Collection[int]) -> dict[int, int]:
+            """Read several holding registers in block reads (from base class)."""
 
     async def read_temperature(self, register: int) -> float | None:
         """Read temperature from register (values in 0.1°C)."""
         value = await self.read_holding_register(register)
         if value is None:
             return None
-        return self.to_temp(value)
+        return to_temp(value)
 
     async def read_humidity(self, register: int) -> float | None:
         """Read humidity from register (values in 0.1%)."""
@@ -41,6 +45,11 @@ class SensorsMixin:
             return None
         return value / 10.0
 
+    async def read_flag(self, register: int) -> bool | None:
+        """Read an on/off register as a bool."""
+        value = await self.read_holding_register(register)
+        return None if value is None else bool(value)
+
     async def read_room_temperature(self) -> float | None:
         """Read room temperature."""
         return await self.read_temperature(MaicoWSRegisters.ROOM_TEMP)
@@ -105,38 +114,23 @@ class SensorsMixin:
 
     async def read_bypass_status(self) -> bool | None:
         """Read bypass actuator status (0=closed, 1=open)."""
-        value = await self.read_holding_register(MaicoWSRegisters.BYPASS_ACTUATOR)
-        if value is None:
-            return None
-        return bool(value)
+        return await self.read_flag(MaicoWSRegisters.BYPASS_ACTUATOR)
 
     async def read_supply_fan_state(self) -> bool | None:
         """Read supply fan state (0=off, 1=on)."""
-        value = await self.read_holding_register(MaicoWSRegisters.SUPPLY_FAN_STATE)
-        if value is None:
-            return None
-        return bool(value)
+        return await self.read_flag(MaicoWSRegisters.SUPPLY_FAN_STATE)
 
     async def read_extract_fan_state(self) -> bool | None:
         """Read extract fan state (0=off, 1=on)."""
-        value = await self.read_holding_register(MaicoWSRegisters.EXTRACT_FAN_STATE)
-        if value is None:
-            return None
-        return bool(value)
+        return await self.read_flag(MaicoWSRegisters.EXTRACT_FAN_STATE)
 
     async def read_ptc_heater_state(self) -> bool | None:
         """Read PTC heater state (0=off, 1=on)."""
-        value = await self.read_holding_register(MaicoWSRegisters.PTC_HEATER)
-        if value is None:
-            return None
-        return bool(value)
+        return await self.read_flag(MaicoWSRegisters.PTC_HEATER)
 
     async def read_boost_ventilation(self) -> bool | None:
         """Read boost ventilation status (0=inactive, 1=active)."""
-        value = await self.read_holding_register(MaicoWSRegisters.BOOST_VENTILATION)
-        if value is None:
-            return None
-        return bool(value)
+        return await self.read_flag(MaicoWSRegisters.BOOST_VENTILATION)
 
     async def read_room_temp_selection(self) -> int | None:
         """Read room temperature sensor selection (0-3)."""
@@ -154,18 +148,57 @@ class SensorsMixin:
         """Read room filter remaining days."""
         return await self.read_holding_register(MaicoWSRegisters.FILTER_REMAIN_ROOM)
 
-    async def read_error_code(self) -> int | None:
-        """Read current error code (combined high and low word)."""
-        hi = await self.read_holding_register(MaicoWSRegisters.CURRENT_ERROR_HI)
-        lo = await self.read_holding_register(MaicoWSRegisters.CURRENT_ERROR_LO)
+    async def read_filter_status(self) -> dict[str, int] | None:
+        """Read the remaining days of the three filters in one block read."""
+        registers = (
+            MaicoWSRegisters.FILTER_REMAIN_DEVICE,
+            MaicoWSRegisters.FILTER_REMAIN_OUTDOOR,
+            MaicoWSRegisters.FILTER_REMAIN_ROOM,
+        )
+        words = await self.read_register_map(registers)
+        if len(words) != len(registers):
+            return None
+        device, outdoor, room = (words[register] for register in registers)
+        return {
+            "filter_device_days": device,
+            "filter_outdoor_days": outdoor,
+            "filter_room_days": room,
+        }
+
+    async def read_u32(self, hi_register: int) -> int | None:
+        """Read a 32-bit value from a high word and the low word after it."""
+        lo_register = hi_register + 1
+        words = await self.read_register_map((hi_register, lo_register))
+        hi = words.get(hi_register)
+        lo = words.get(lo_register)
         if hi is None or lo is None:
             return None
-        return (hi << 16) | lo
+        return combine_words(hi, lo)
+
+    async def read_error_code(self) -> int | None:
+        """Read current error code (combined high and low word)."""
+        return await self.read_u32(MaicoWSRegisters.CURRENT_ERROR_HI)
 
     async def read_info_code(self) -> int | None:
         """Read current info code (combined high and low word)."""
-        hi = await self.read_holding_register(MaicoWSRegisters.CURRENT_INFO_HI)
-        lo = await self.read_holding_register(MaicoWSRegisters.CURRENT_INFO_LO)
-        if hi is None or lo is None:
-            return None
-        return (hi << 16) | lo
+        return await self.read_u32(MaicoWSRegisters.CURRENT_INFO_HI)
+
+    async def read_hours_humidity(self) -> int | None:
+        """Read operating hours in humidity protection."""
+        return await self.read_u32(MaicoWSRegisters.HOURS_HUMIDITY_HI)
+
+    async def read_hours_reduced(self) -> int | None:
+        """Read operating hours in reduced ventilation."""
+        return await self.read_u32(MaicoWSRegisters.HOURS_REDUCED_HI)
+
+    async def read_hours_nominal(self) -> int | None:
+        """Read operating hours in nominal ventilation."""
+        return await self.read_u32(MaicoWSRegisters.HOURS_NOMINAL_HI)
+
+    async def read_hours_intensive(self) -> int | None:
+        """Read operating hours in intensive ventilation."""
+        return await self.read_u32(MaicoWSRegisters.HOURS_INTENSIVE_HI)
+
+    async def read_hours_total(self) -> int | None:
+        """Read total operating hours."""
+        return await self.read_u32(MaicoWSRegisters.HOURS_TOTAL_HI)
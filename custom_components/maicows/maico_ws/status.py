@@ -2,227 +2,562 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import struct
+from collections.abc import Callable, Container, Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from pymodbus.exceptions import ModbusException
+
+from .client import MAX_REGISTERS_PER_READ
 from .registers import MaicoWSRegisters
 
 _LOGGER = logging.getLogger(__name__)
 
+# Modbus function code used for status polling (Read Holding Registers)
+FC_READ_HOLDING_REGISTERS = 3
+
+# Largest hole (in registers) bridged when merging neighbouring fields into one
+# read. 0 only merges strictly contiguous fields; raise it to trade a few unused
+# registers for fewer round-trips.
+MAX_GAP = 0
+
+# Poll divider for settings and counters that change on minute/hour timescales
+SLOW_SCAN_DIVIDER = 6
+
+_FC03 = FC_READ_HOLDING_REGISTERS
+
+# Status fields polled from the device: (name, function code, address, length)
+REGISTER_MAP: tuple[tuple[str, int, int, int], ...] = (
+    # Basic configuration
+    ("room_temp_selection", _FC03, MaicoWSRegisters.ROOM_TEMP_SELECTION, 1),
+    # Filter/Flow settings
+    ("filter_device_months", _FC03, MaicoWSRegisters.FILTER_DEVICE_MONTHS, 1),
+    ("filter_outdoor_months", _FC03, MaicoWSRegisters.FILTER_OUTDOOR_MONTHS, 1),
+    ("filter_room_months", _FC03, MaicoWSRegisters.FILTER_ROOM_MONTHS, 1),
+    ("filter_duration", _FC03, MaicoWSRegisters.FILTER_DURATION, 1),
+    ("volume_flow_reduced", _FC03, MaicoWSRegisters.VOLUME_FLOW_REDUCED, 1),
+    ("volume_flow_normal", _FC03, MaicoWSRegisters.VOLUME_FLOW_NORMAL, 1),
+    ("volume_flow_intensive", _FC03, MaicoWSRegisters.VOLUME_FLOW_INTENSIVE, 1),
+    # Temperature settings
+    ("room_temp_adjust", _FC03, MaicoWSRegisters.ROOM_TEMP_ADJUST, 1),
+    ("supply_temp_min_cool", _FC03, MaicoWSRegisters.SUPPLY_TEMP_MIN_COOL, 1),
+    ("room_temp_max", _FC03, MaicoWSRegisters.ROOM_TEMP_MAX, 1),
+    # Faults/Info (high and low words)
+    ("fault_status", _FC03, MaicoWSRegisters.CURRENT_ERROR_HI, 2),
+    ("info_messages", _FC03, MaicoWSRegisters.CURRENT_INFO_HI, 2),
+    # Operation
+    ("operation_mode", _FC03, MaicoWSRegisters.OPERATION_MODE, 1),
+    ("boost_ventilation", _FC03, MaicoWSRegisters.BOOST_VENTILATION, 1),
+    ("season", _FC03, MaicoWSRegisters.SEASON, 1),
+    ("target_temperature", _FC03, MaicoWSRegisters.TARGET_ROOM_TEMP, 1),
+    ("ventilation_level", _FC03, MaicoWSRegisters.VENTILATION_LEVEL, 1),
+    # Ventilation/Fan
+    ("current_ventilation_level", _FC03, MaicoWSRegisters.CURRENT_VENTILATION_LEVEL, 1),
+    ("supply_fan_speed", _FC03, MaicoWSRegisters.SUPPLY_FAN_SPEED, 1),
+    ("extract_fan_speed", _FC03, MaicoWSRegisters.EXTRACT_FAN_SPEED, 1),
+    ("current_supply_volume_flow", _FC03, MaicoWSRegisters.SUPPLY_VOLUME_FLOW, 1),
+    ("current_extract_volume_flow", _FC03, MaicoWSRegisters.EXTRACT_VOLUME_FLOW, 1),
+    ("filter_status", _FC03, MaicoWSRegisters.FILTER_REMAIN_DEVICE, 3),
+    # Temperatures
+    ("room_temperature", _FC03, MaicoWSRegisters.ROOM_TEMP, 1),
+    ("room_temperature_ext", _FC03, MaicoWSRegisters.ROOM_TEMP_EXT, 1),
+    ("temperature_before_ewt", _FC03, MaicoWSRegisters.TEMP_BEFORE_EWT, 1),
+    ("inlet_air_temperature", _FC03, MaicoWSRegisters.INLET_AIR_TEMP, 1),
+    ("supply_air_temperature", _FC03, MaicoWSRegisters.SUPPLY_AIR_TEMP, 1),
+    ("extract_air_temperature", _FC03, MaicoWSRegisters.EXTRACT_AIR_TEMP, 1),
+    ("exhaust_air_temperature", _FC03, MaicoWSRegisters.EXHAUST_AIR_TEMP, 1),
+    ("room_temperature_bus", _FC03, MaicoWSRegisters.ROOM_TEMP_BUS, 1),
+    # Humidity, CO2, VOC
+    ("extract_air_humidity", _FC03, MaicoWSRegisters.EXTRACT_AIR_HUMIDITY, 1),
+    ("humidity_sensor_1", _FC03, MaicoWSRegisters.HUMIDITY_SENSOR_1, 1),
+    ("humidity_sensor_2", _FC03, MaicoWSRegisters.HUMIDITY_SENSOR_2, 1),
+    ("humidity_sensor_3", _FC03, MaicoWSRegisters.HUMIDITY_SENSOR_3, 1),
+    ("humidity_sensor_4", _FC03, MaicoWSRegisters.HUMIDITY_SENSOR_4, 1),
+    ("co2_sensor_1", _FC03, MaicoWSRegisters.CO2_SENSOR_1, 1),
+    ("co2_sensor_2", _FC03, MaicoWSRegisters.CO2_SENSOR_2, 1),
+    ("co2_sensor_3", _FC03, MaicoWSRegisters.CO2_SENSOR_3, 1),
+    ("co2_sensor_4", _FC03, MaicoWSRegisters.CO2_SENSOR_4, 1),
+    ("voc_sensor_1", _FC03, MaicoWSRegisters.VOC_SENSOR_1, 1),
+    ("voc_sensor_2", _FC03, MaicoWSRegisters.VOC_SENSOR_2, 1),
+    ("voc_sensor_3", _FC03, MaicoWSRegisters.VOC_SENSOR_3, 1),
+    ("voc_sensor_4", _FC03, MaicoWSRegisters.VOC_SENSOR_4, 1),
+    ("humidity_bus", _FC03, MaicoWSRegisters.HUMIDITY_BUS, 1),
+    ("air_quality_bus", _FC03, MaicoWSRegisters.AIR_QUALITY_BUS, 1),
+    # Switch states
+    ("supply_fan_state", _FC03, MaicoWSRegisters.SUPPLY_FAN_STATE, 1),
+    ("extract_fan_state", _FC03, MaicoWSRegisters.EXTRACT_FAN_STATE, 1),
+    ("bypass_status", _FC03, MaicoWSRegisters.BYPASS_ACTUATOR, 1),
+    ("ptc_heater", _FC03, MaicoWSRegisters.PTC_HEATER, 1),
+    ("switch_contact", _FC03, MaicoWSRegisters.SWITCH_CONTACT, 1),
+    ("post_heater_relay", _FC03, MaicoWSRegisters.POST_HEATER_RELAY, 1),
+    ("brine_pump", _FC03, MaicoWSRegisters.BRINE_PUMP, 1),
+    ("three_way_damper", _FC03, MaicoWSRegisters.THREE_WAY_DAMPER, 1),
+    ("zone_damper", _FC03, MaicoWSRegisters.ZONE_DAMPER, 1),
+    # Operating hours (high and low words)
+    ("hours_humidity", _FC03, MaicoWSRegisters.HOURS_HUMIDITY_HI, 2),
+    ("hours_reduced", _FC03, MaicoWSRegisters.HOURS_REDUCED_HI, 2),
+    ("hours_nominal", _FC03, MaicoWSRegisters.HOURS_NOMINAL_HI, 2),
+    ("hours_intensive", _FC03, MaicoWSRegisters.HOURS_INTENSIVE_HI, 2),
+    ("hours_total", _FC03, MaicoWSRegisters.HOURS_TOTAL_HI, 2),
+)
+
+
+# Fields read only every Nth poll (all others are read on every poll)
+SCAN_DIVIDERS: dict[str, int] = {
+    "room_temp_selection": SLOW_SCAN_DIVIDER,
+    "filter_device_months": SLOW_SCAN_DIVIDER,
+    "filter_outdoor_months": SLOW_SCAN_DIVIDER,
+    "filter_room_months": SLOW_SCAN_DIVIDER,
+    "filter_duration": SLOW_SCAN_DIVIDER,
+    "volume_flow_reduced": SLOW_SCAN_DIVIDER,
+    "volume_flow_normal": SLOW_SCAN_DIVIDER,
+    "volume_flow_intensive": SLOW_SCAN_DIVIDER,
+    "room_temp_adjust": SLOW_SCAN_DIVIDER,
+    "supply_temp_min_cool": SLOW_SCAN_DIVIDER,
+    "room_temp_max": SLOW_SCAN_DIVIDER,
+    "hours_humidity": SLOW_SCAN_DIVIDER,
+    "hours_reduced": SLOW_SCAN_DIVIDER,
+    "hours_nominal": SLOW_SCAN_DIVIDER,
+    "hours_intensive": SLOW_SCAN_DIVIDER,
+    "hours_total": SLOW_SCAN_DIVIDER,
+}
+
+
+class ReadGroup(NamedTuple):
+    """Contiguous register span fetched with a single Modbus request."""
+
+    fc: int
+    start: int
+    count: int
+    scan_divider: int = 1
+
+
+def _plan_reads(
+    register_map: tuple[tuple[str, int, int, int], ...],
+    scan_dividers: dict[str, int] | None = None,
+    max_gap: int = MAX_GAP,
+    max_count: int = MAX_REGISTERS_PER_READ,
+) -> tuple[tuple[ReadGroup, ...], dict[str, tuple[int, int, int]]]:
+    """
+    Fold the register map into as few reads as possible.
+
+    Only fields sharing the same function code and scan divider are merged.
+    Returns the read groups and, for each field, its (group index, word offset,
+    length) inside the group response.
+    """
+    scan_dividers = scan_dividers or {}
+    groups: list[ReadGroup] = []
+    fields: dict[str, tuple[int, int, int]] = {}
+
+    for name, fc, address, length in sorted(
+        register_map,
+        key=lambda field: (field[1], scan_dividers.get(field[0], 1), field[2]),
+    ):
+        divider = scan_dividers.get(name, 1)
+        if groups:
+            last = groups[-1]
+            end = address + length
+            if (
+                last.fc == fc
+                and last.scan_divider == divider
+                and address - (last.start + last.count) <= max_gap
+                and end - last.start <= max_count
+            ):
+                groups[-1] = last._replace(count=max(last.count, end - last.start))
+                fields[name] = (len(groups) - 1, address - last.start, length)
+                continue
+
+        groups.append(ReadGroup(fc, address, length, divider))
+        fields[name] = (len(groups) - 1, 0, length)
+
+    return tuple(groups), fields
+
+
+# Read plan computed once at import time
+READ_PLAN, FIELD_OFFSETS = _plan_reads(REGISTER_MAP, SCAN_DIVIDERS)
+
+# Value maps
+_MODE_MAP = {
+    0: "off",
+    1: "manual",
+    2: "auto_time",
+    3: "auto_sensor",
+    4: "eco_supply",
+    5: "eco_extract",
+}
+_SEASON_MAP = {0: "winter", 1: "summer"}
+_ROOM_SEL_MAP = {0: "comfort_bde", 1: "external", 2: "internal", 3: "bus"}
+
+
+# Decoders receive the unpacked values of their read group and the field index
+Decoder = Callable[[tuple[Any, ...], int], Any]
+
+
+def _raw(values: tuple[Any, ...], index: int) -> int:
+    """Return the register value unchanged."""
+    return values[index]
+
+
+def _temp(values: tuple[Any, ...], index: int) -> float:
+    """Decode a signed temperature in 0.1°C."""
+    return values[index] / 10.0
+
+
+def _tenth(values: tuple[Any, ...], index: int) -> float:
+    """Decode a value stored in tenths."""
+    return values[index] / 10.0
+
+
+def _flag(values: tuple[Any, ...], index: int) -> bool:
+    """Decode a 0/1 state."""
+    return bool(values[index])
+
+
+def _mapped(mapping: dict[int, str]) -> Decoder:
+    """Build a decoder looking the register value up in a map."""
+
+    def decode(values: tuple[Any, ...], index: int) -> str:
+        value = values[index]
+        name = mapping.get(value)
+        # Only format a fallback name for values outside the map
+        return f"unknown_{value}" if name is None else name
+
+    return decode
+
+
+def _filter_status(values: tuple[Any, ...], index: int) -> dict[str, int]:
+    """Decode the remaining days of the three filters."""
+    return {
+        "filter_device_days": values[index],
+        "filter_outdoor_days": values[index + 1],
+        "filter_room_days": values[index + 2],
+    }
+
+
+def _fault_status(values: tuple[Any, ...], index: int) -> str:
+    """Decode the current error words."""
+    err_hi, err_lo = values[index], values[index + 1]
+    if err_hi == 0 and err_lo == 0:
+        return "no_fault"
+    return f"error_hi_{err_hi}_lo_{err_lo}"
+
+
+def _info_messages(values: tuple[Any, ...], index: int) -> str:
+    """Decode the current info words."""
+    info_hi, info_lo = values[index], values[index + 1]
+    if info_hi == 0 and info_lo == 0:
+        return "no_info"
+    return f"info_hi_{info_hi}_lo_{info_lo}"
+
+
+# Big-endian struct codes of each field (one letter per unpacked value):
+# H = uint16, h = int16, I = uint32 from high and low words
+_U16 = "H"
+_S16 = "h"
+_U32 = "I"
+
+# Struct codes and decoder of each field
+_DECODERS: dict[str, tuple[str, Decoder]] = {
+    "room_temp_selection": (_U16, _mapped(_ROOM_SEL_MAP)),
+    "filter_device_months": (_U16, _raw),
+    "filter_outdoor_months": (_U16, _raw),
+    "filter_room_months": (_U16, _raw),
+    "filter_duration": (_U16, _raw),
+    "volume_flow_reduced": (_U16, _raw),
+    "volume_flow_normal": (_U16, _raw),
+    "volume_flow_intensive": (_U16, _raw),
+    "room_temp_adjust": (_S16, _temp),
+    "supply_temp_min_cool": (_U16, _raw),
+    "room_temp_max": (_S16, _temp),
+    "fault_status": (_U16 * 2, _fault_status),
+    "info_messages": (_U16 * 2, _info_messages),
+    "operation_mode": (_U16, _mapped(_MODE_MAP)),
+    "boost_ventilation": (_U16, _flag),
+    "season": (_U16, _mapped(_SEASON_MAP)),
+    "target_temperature": (_S16, _temp),
+    "ventilation_level": (_U16, _raw),
+    "current_ventilation_level": (_U16, _raw),
+    "supply_fan_speed": (_U16, _raw),
+    "extract_fan_speed": (_U16, _raw),
+    "current_supply_volume_flow": (_U16, _raw),
+    "current_extract_volume_flow": (_U16, _raw),
+    "filter_status": (_U16 * 3, _filter_status),
+    "room_temperature": (_S16, _temp),
+    "room_temperature_ext": (_S16, _temp),
+    "temperature_before_ewt": (_S16, _temp),
+    "inlet_air_temperature": (_S16, _temp),
+    "supply_air_temperature": (_S16, _temp),
+    "extract_air_temperature": (_S16, _temp),
+    "exhaust_air_temperature": (_S16, _temp),
+    "room_temperature_bus": (_S16, _temp),
+    "extract_air_humidity": (_U16, _raw),
+    "humidity_sensor_1": (_U16, _raw),
+    "humidity_sensor_2": (_U16, _raw),
+    "humidity_sensor_3": (_U16, _raw),
+    "humidity_sensor_4": (_U16, _raw),
+    "co2_sensor_1": (_U16, _tenth),
+    "co2_sensor_2": (_U16, _tenth),
+    "co2_sensor_3": (_U16, _tenth),
+    "co2_sensor_4": (_U16, _tenth),
+    "voc_sensor_1": (_U16, _tenth),
+    "voc_sensor_2": (_U16, _tenth),
+    "voc_sensor_3": (_U16, _tenth),
+    "voc_sensor_4": (_U16, _tenth),
+    "humidity_bus": (_U16, _raw),
+    "air_quality_bus": (_U16, _raw),
+    "supply_fan_state": (_U16, _flag),
+    "extract_fan_state": (_U16, _flag),
+    "bypass_status": (_U16, _flag),
+    "ptc_heater": (_U16, _flag),
+    "switch_contact": (_U16, _flag),
+    "post_heater_relay": (_U16, _flag),
+    "brine_pump": (_U16, _raw),
+    "three_way_damper": (_U16, _raw),
+    "zone_damper": (_U16, _raw),
+    "hours_humidity": (_U32, _raw),
+    "hours_reduced": (_U32, _raw),
+    "hours_nominal": (_U32, _raw),
+    "hours_intensive": (_U32, _raw),
+    "hours_total": (_U32, _raw),
+}
+
+
+def _build_decode_plan() -> tuple[
+    tuple[tuple[struct.Struct, struct.Struct], ...],
+    tuple[tuple[str, int, int, Decoder], ...],
+]:
+    """
+    Precompile the struct layout of every read group.
+
+    Returns, per group, the struct packing the raw words and the struct
+    unpacking them into field values, plus the flat (name, group index,
+    value index, decoder) table walked on every poll.
+    """
+    by_group: dict[int, list[tuple[int, str]]] = {}
+    for name, (group_index, offset, _length) in FIELD_OFFSETS.items():
+        by_group.setdefault(group_index, []).append((offset, name))
+
+    structs: list[tuple[struct.Struct, struct.Struct]] = []
+    field_decoders: list[tuple[str, int, int, Decoder]] = []
+    for group_index, group in enumerate(READ_PLAN):
+        fmt = ">"
+        word = 0
+        value_index = 0
+        for offset, name in sorted(by_group.get(group_index, [])):
+            codes, decoder = _DECODERS[name]
+            if offset > word:
+                # Skip registers bridged by MAX_GAP
+                fmt += f"{(offset - word) * 2}x"
+            field_decoders.append((name, group_index, value_index, decoder))
+            fmt += codes
+            value_index += len(codes)
+            word = offset + FIELD_OFFSETS[name][2]
+        if word < group.count:
+            fmt += f"{(group.count - word) * 2}x"
+        structs.append((struct.Struct(f">{group.count}H"), struct.Struct(fmt)))
+
+    return tuple(structs), tuple(field_decoders)
+
+
+# Group structs and flat field table computed once at import time
+_GROUP_STRUCTS, _FIELD_DECODERS = _build_decode_plan()
+
+
+def _unpack_group(group_index: int, block: list[int]) -> tuple[Any, ...]:
+    """Unpack the raw words of a read group into its field values."""
+    packer, unpacker = _GROUP_STRUCTS[group_index]
+    return unpacker.unpack(packer.pack(*block))
+
+
+def _decode_blocks(
+    status: dict[str, Any],
+    blocks: list[list[int] | None],
+    changed: Container[int],
+) -> None:
+    """Decode the fields of the changed groups into the status dict."""
+    unpacked: dict[int, tuple[Any, ...]] = {}
+    for name, group_index, value_index, decode in _FIELD_DECODERS:
+        # Unchanged registers keep their previously decoded value
+        if group_index not in changed and name in status:
+            continue
+        block = blocks[group_index]
+        if block is None:
+            # Leave out fields whose group could not be read
+            status.pop(name, None)
+            continue
+        values = unpacked.get(group_index)
+        if values is None:
+            values = unpacked[group_index] = _unpack_group(group_index, block)
+        status[name] = decode(values, value_index)
+
+    # Calculate power state from operation mode, if it could be read
+    mode = status.get("operation_mode")
+    if mode is None:
+        status.pop("power_state", None)
+    else:
+        status["power_state"] = mode != "off"
+
 
 class StatusMixin:
     """Mixin providing status aggregation for MaicoWS."""
 
+    __slots__ = ()
+
     # These will be provided by the base class
     _connected: bool
-
-    async def read_holding_registers(
-        self, register: int, count: int
-    ) -> list[int] | None:
-        """Read multiple holding registers (from base class)."""
-
-    async def read_holding_register(self, register: int) -> int | None:
-        """Read single holding register (from base class)."""
-
-    async def read_operation_mode(self) -> int | None:
-        """Read operation mode (from sensors mixin)."""
+    _poll_count: int
+    _status_blocks: list[list[int] | None]
+    _written_registers: set[int]
+    _changed_groups: set[int]
+    _group_generations: list[int]
+    _status_dest: dict[str, Any] | None
+    _status_dest_generations: list[int]
+    _failed_groups: set[int]
+    _status_poll: asyncio.Future[list[list[int] | None] | None] | None
+
+    if TYPE_CHECKING:
+        # Resolved through the MRO at run time, declared here for type checkers
+        async def read_holding_registers(
+            self, register: int, count: int
+        ) -> list[int] | None:
+            """Read multiple holding registers (from base class)."""
+
+        async def read_blocks(
+            self, spans: Iterable[tuple[int, int]]
+        ) -> list[list[int] | None]:
+            """Read register spans (from base class)."""
+
+        async def read_operation_mode(self) -> int | None:
+            """Read operation mode (from sensors mixin)."""
+
+        def _link_ready(self) -> bool:
+            """Return whether the Modbus link is up (from base class)."""
+
+        def _current_read_cache(self) -> dict[int, int]:
+            """Return the unexpired read cache (from base class)."""
+
+    @property
+    def status_changed(self) -> bool:
+        """Return whether the last read_all_registers_into changed its dict."""
+        return bool(self._changed_groups)
 
     async def get_all_status(self) -> dict[str, Any] | None:
-        """Read all status data using sequential block reads."""
-        if not self._connected:
-            _LOGGER.error("Not connected to Maico WS")
+        """Read all status data using one block read per read group."""
+        blocks = await self._read_status_blocks()
+        if blocks is None:
             return None
 
-        results = []
-        try:
-            # Settings block (300-302)
-            results.append(await self.read_holding_registers(300, 3))
-            # Ventilation/Fan block (650-657)
-            results.append(await self.read_holding_registers(650, 8))
-            # Temperatures block (700-707)
-            results.append(await self.read_holding_registers(700, 8))
-            # Humidity, CO2, VOC block (750-764)
-            results.append(await self.read_holding_registers(750, 15))
-            # Operation mode block (550-554)
-            results.append(await self.read_holding_registers(550, 5))
-            # Switch states block (800-808)
-            results.append(await self.read_holding_registers(800, 9))
-            # Faults/Info block (401-404)
-            results.append(await self.read_holding_registers(401, 4))
-            # Filter/Flow settings (150-159)
-            results.append(await self.read_holding_registers(150, 10))
-            # Operating hours (850-859)
-            results.append(await self.read_holding_registers(850, 10))
-            # Room temp selection (109)
-            results.append(await self.read_holding_register(109))
-        except Exception:
-            _LOGGER.exception("Error during status update")
+        # A fresh dict takes every group and leaves the change tracking of
+        # read_all_registers_into callers untouched
+        status: dict[str, Any] = {}
+        _decode_blocks(status, blocks, range(len(blocks)))
+        return status
+
+    async def read_all_registers_into(
+        self, status: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Read all status data, updating the given dict in place."""
+        blocks = await self._read_status_blocks()
+        if blocks is None:
             return None
 
-        return self._process_status_results(results)
-
-    def _process_status_results(self, results: list) -> dict[str, Any]:  # noqa: PLR0912, PLR0915
-        """Process the results from Modbus reads."""
-        (
-            settings_block,
-            vent_block,
-            temp_block,
-            hum_block,
-            op_block,
-            switch_block,
-            fault_block,
-            filter_flow_block,
-            hours_block,
-            room_temp_sel,
-        ) = results
+        # Groups count as changed against what was last decoded into this
+        # dict, so polls made for other callers in between are not missed
+        generations = self._group_generations
+        if status is self._status_dest:
+            applied = self._status_dest_generations
+        else:
+            applied = [-1] * len(generations)
+        changed = {
+            index
+            for index, generation in enumerate(generations)
+            if generation != applied[index]
+        }
+        _decode_blocks(status, blocks, changed)
+
+        self._changed_groups = changed
+        self._status_dest = status
+        self._status_dest_generations = generations.copy()
+        return status
 
-        status: dict[str, Any] = {}
+    async def _read_status_blocks(self) -> list[list[int] | None] | None:
+        """Refresh the due read groups, joining a poll already in flight."""
+        poll = self._status_poll
+        if poll is None:
+            poll = self._status_poll = asyncio.ensure_future(self._poll_status_blocks())
+            poll.add_done_callback(self._status_poll_done)
+        # A cancelled caller must not cancel the poll other callers wait on
+        return await asyncio.shield(poll)
+
+    def _status_poll_done(self, _poll: asyncio.Future) -> None:
+        """Let the next caller start a new poll."""
+        self._status_poll = None
+
+    async def _poll_status_blocks(self) -> list[list[int] | None] | None:
+        """Refresh the due read groups and return the cached group blocks."""
+        # A link being re-established fails the poll instead of serving
+        # the last blocks, so the coordinator marks the entities unavailable
+        if not self._link_ready():
+            return None
 
-        # Helper functions
-        def to_temp(raw: int) -> float:
-            """Convert raw to temperature."""
-            if raw > MaicoWSRegisters.MAX_INT_16BIT:
-                raw -= 65536
-            return raw / 10.0
-
-        def combine(hi: int, lo: int) -> int:
-            """Combine high and low words."""
-            return (hi << 16) | lo
-
-        # 1. Settings Block (300-302)
-        if settings_block:
-            status["room_temp_adjust"] = to_temp(settings_block[0])
-            status["supply_temp_min_cool"] = settings_block[1]
-            status["room_temp_max"] = to_temp(settings_block[2])
-
-        # 2. Ventilation/Fan Block (650-657)
-        if vent_block:
-            status["current_ventilation_level"] = vent_block[0]
-            status["supply_fan_speed"] = vent_block[1]
-            status["extract_fan_speed"] = vent_block[2]
-            status["current_supply_volume_flow"] = vent_block[3]
-            status["current_extract_volume_flow"] = vent_block[4]
-            status["filter_status"] = {
-                "filter_device_days": vent_block[5],
-                "filter_outdoor_days": vent_block[6],
-                "filter_room_days": vent_block[7],
-            }
-
-        # 3. Temperatures Block (700-707)
-        if temp_block:
-            status["room_temperature"] = to_temp(temp_block[0])
-            status["room_temperature_ext"] = to_temp(temp_block[1])
-            # temp_block[2] = 702 (before EWT)
-            status["inlet_air_temperature"] = to_temp(temp_block[3])
-            status["supply_air_temperature"] = to_temp(temp_block[4])
-            status["extract_air_temperature"] = to_temp(temp_block[5])
-            status["exhaust_air_temperature"] = to_temp(temp_block[6])
-            status["room_temperature_bus"] = to_temp(temp_block[7])
-
-        # 4. Humidity, CO2, VOC Block (750-764)
-        if hum_block:
-            status["extract_air_humidity"] = hum_block[0]
-            if len(hum_block) > 4:  # noqa: PLR2004
-                status["humidity_sensor_1"] = hum_block[1]
-                status["humidity_sensor_2"] = hum_block[2]
-                status["humidity_sensor_3"] = hum_block[3]
-                status["humidity_sensor_4"] = hum_block[4]
-
-            if len(hum_block) > 8:  # noqa: PLR2004
-                status["co2_sensor_1"] = hum_block[5] / 10.0
-                status["co2_sensor_2"] = hum_block[6] / 10.0
-                status["co2_sensor_3"] = hum_block[7] / 10.0
-                status["co2_sensor_4"] = hum_block[8] / 10.0
-
-            if len(hum_block) > 12:  # noqa: PLR2004
-                status["voc_sensor_1"] = hum_block[9] / 10.0
-                status["voc_sensor_2"] = hum_block[10] / 10.0
-                status["voc_sensor_3"] = hum_block[11] / 10.0
-                status["voc_sensor_4"] = hum_block[12] / 10.0
-
-            if len(hum_block) > 14:  # noqa: PLR2004
-                status["humidity_bus"] = hum_block[13]
-                status["air_quality_bus"] = hum_block[14]
-
-        # 5. Operation Mode Block (550-554)
-        if op_block:
-            mode_map = {
-                0: "off",
-                1: "manual",
-                2: "auto_time",
-                3: "auto_sensor",
-                4: "eco_supply",
-                5: "eco_extract",
-            }
-            status["operation_mode"] = mode_map.get(
-                op_block[0], f"unknown_{op_block[0]}"
-            )
-            status["boost_ventilation"] = bool(op_block[1])
-            season_map = {0: "winter", 1: "summer"}
-            status["season"] = season_map.get(op_block[2], f"unknown_{op_block[2]}")
-            status["target_temperature"] = to_temp(op_block[3])
-            status["ventilation_level"] = op_block[4]
-
-        # 6. Switch States Block (800-808)
-        if switch_block:
-            status["supply_fan_state"] = bool(switch_block[0])
-            status["extract_fan_state"] = bool(switch_block[1])
-            status["bypass_status"] = bool(switch_block[2])
-            status["ptc_heater"] = bool(switch_block[3])
-            if len(switch_block) > 4:  # noqa: PLR2004
-                status["switch_contact"] = bool(switch_block[4])
-            if len(switch_block) > 5:  # noqa: PLR2004
-                status["post_heater_relay"] = bool(switch_block[5])
-            if len(switch_block) > 6:  # noqa: PLR2004
-                status["brine_pump"] = switch_block[6]
-            if len(switch_block) > 7:  # noqa: PLR2004
-                status["three_way_damper"] = switch_block[7]
-            if len(switch_block) > 8:  # noqa: PLR2004
-                status["zone_damper"] = switch_block[8]
-
-        # 7. Faults/Info Block (401-404)
-        if fault_block:
-            err_hi, err_lo, info_hi, info_lo = fault_block
-            status["fault_status"] = (
-                "no_fault"
-                if (err_hi == 0 and err_lo == 0)
-                else f"error_hi_{err_hi}_lo_{err_lo}"
-            )
-            status["info_messages"] = (
-                "no_info"
-                if (info_hi == 0 and info_lo == 0)
-                else f"info_hi_{info_hi}_lo_{info_lo}"
+        if len(self._status_blocks) != len(READ_PLAN):
+            self._status_blocks = [None] * len(READ_PLAN)
+            self._group_generations = [0] * len(READ_PLAN)
+
+        blocks = self._status_blocks
+        # Slow groups are served from cache between scans unless empty or
+        # touched by a write since the last poll
+        due = [
+            index
+            for index, group in enumerate(READ_PLAN)
+            if self._poll_count % group.scan_divider == 0
+            or blocks[index] is None
+            or index in self._failed_groups
+            or any(
+                group.start <= register < group.start + group.count
+                for register in self._written_registers
             )
+        ]
 
-        # 8. Filter/Flow Settings (150-159)
-        if filter_flow_block:
-            status["filter_device_months"] = filter_flow_block[0]
-            status["filter_outdoor_months"] = filter_flow_block[1]
-            status["filter_room_months"] = filter_flow_block[2]
-            status["filter_duration"] = filter_flow_block[3]
-            status["volume_flow_reduced"] = filter_flow_block[4]
-            status["volume_flow_normal"] = filter_flow_block[5]
-            status["volume_flow_intensive"] = filter_flow_block[6]
-
-        # 9. Operating Hours (850-859)
-        if hours_block:
-            status["hours_humidity"] = combine(hours_block[0], hours_block[1])
-            status["hours_reduced"] = combine(hours_block[2], hours_block[3])
-            status["hours_nominal"] = combine(hours_block[4], hours_block[5])
-            status["hours_intensive"] = combine(hours_block[6], hours_block[7])
-            status["hours_total"] = combine(hours_block[8], hours_block[9])
-
-        # 10. Room Temp Selection (109)
-        if room_temp_sel is not None:
-            room_sel_map = {0: "comfort_bde", 1: "external", 2: "internal", 3: "bus"}
-            status["room_temp_selection"] = room_sel_map.get(
-                room_temp_sel, f"unknown_{room_temp_sel}"
+        try:
+            results = await self.read_blocks(
+                (READ_PLAN[index].start, READ_PLAN[index].count) for index in due
             )
+        except (ModbusException, OSError) as err:
+            _LOGGER.debug("Error during status update: %s", err)
+            return None
 
-        # Calculate power state from operation mode
-        status["power_state"] = status.get("operation_mode") != "off"
+        if all(result is None for result in results):
+            # Device unreachable: report the poll as failed, keep the blocks
+            # so a recovered device is not reported as entirely changed
+            return None
 
-        return status
+        cache = self._current_read_cache()
+        failed = self._failed_groups
+        for index, result in zip(due, results, strict=True):
+            block = result
+            if block is not None and len(block) < READ_PLAN[index].count:
+                block = None
+            if block is None and index not in failed:
+                # Ride out a single failed read on the last good block
+                failed.add(index)
+                continue
+            failed.discard(index)
+            # Drop groups failing twice in a row so their fields are left out
+            if block != blocks[index]:
+                self._group_generations[index] += 1
+                blocks[index] = block
+            if block is not None:
+                # Serve single register reads of this refresh from the block
+                start = READ_PLAN[index].start
+                cache.update(zip(range(start, start + len(block)), block, strict=True))
+
+        self._poll_count += 1
+        self._written_registers.clear()
+
+        return blocks
 
     async def read_all_registers(self) -> dict[str, Any] | None:
         """Alias for get_all_status (backward compatibility)."""
@@ -233,8 +568,6 @@ class StatusMixin:
         if not self._connected:
             return None
 
-        val = await self.read_holding_register(MaicoWSRegisters.OPERATION_MODE)
-        if val is None:
-            return None
-
+        # The device exposes no identity registers; the status poll already
+        # proves the link, so no probe read is needed here
         return {"serial_number": "maico_ws320b_device"}
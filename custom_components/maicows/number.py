@@ -10,7 +10,7 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MaicoCoordinator
-from .const import DOMAIN
+from .maico_ws.client import from_temp
 from .maico_ws_api import MaicoWSRegisters
 
 if TYPE_CHECKING:
@@ -22,12 +22,12 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B number platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
     entities = [
         MaicoWS320BSupplyTempMinCoolNumber(coordinator),
@@ -123,7 +123,7 @@ async def async_setup_entry(
         ),
     ]
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class MaicoWS320BSupplyTempMinCoolNumber(
@@ -138,7 +138,7 @@ class MaicoWS320BSupplyTempMinCoolNumber(
         """Initialize the number."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_supply_temp_min_cool"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_supply_temp_min_cool"
         self._attr_device_info = coordinator.device_info
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_native_min_value = 8.0  # From documentation: 8°C
@@ -171,7 +171,7 @@ class MaicoWS320BMaxRoomTempNumber(CoordinatorEntity[MaicoCoordinator], NumberEn
         """Initialize the number."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_room_temp_max"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_room_temp_max"
         self._attr_device_info = coordinator.device_info
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_native_min_value = 18.0  # From documentation: 18°C
@@ -204,7 +204,7 @@ class MaicoRoomTempAdjustNumber(CoordinatorEntity[MaicoCoordinator], NumberEntit
         """Initialize the number."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_room_temp_adjust"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_room_temp_adjust"
         self._attr_device_info = coordinator.device_info
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_native_min_value = -3.0  # From documentation: -3°C
@@ -221,7 +221,7 @@ class MaicoRoomTempAdjustNumber(CoordinatorEntity[MaicoCoordinator], NumberEntit
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         # Register 300 stores values in 0.1°C increments
-        raw_value = int(value * 10)
+        raw_value = from_temp(value)
         success = await self._api.write_register(
             MaicoWSRegisters.ROOM_TEMP_ADJUST, raw_value
         )
@@ -253,7 +253,7 @@ class MaicoWS320BConfigNumber(CoordinatorEntity[MaicoCoordinator], NumberEntity)
         self._key = key
         self._register = register
         self._attr_translation_key = key
-        self._attr_unique_id = f"{coordinator.api.host}_{coordinator.api.port}_{key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
         self._attr_device_info = coordinator.device_info
         self._attr_native_min_value = min_val
         self._attr_native_max_value = max_val
@@ -295,7 +295,7 @@ class MaicoExternalTempNumber(CoordinatorEntity[MaicoCoordinator], NumberEntity)
         self._key = key
         self._register = register
         self._attr_translation_key = key
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_{key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
         self._attr_device_info = coordinator.device_info
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_native_min_value = -20.0
@@ -312,7 +312,7 @@ class MaicoExternalTempNumber(CoordinatorEntity[MaicoCoordinator], NumberEntity)
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         # Temperature values are stored as °C * 10
-        raw_value = int(value * 10)
+        raw_value = from_temp(value)
         _LOGGER.debug(
             "Writing %s: value=%.1f°C, raw=%d, register=%d",
             self._key,
@@ -349,7 +349,7 @@ class MaicoBusSensorNumber(CoordinatorEntity[MaicoCoordinator], NumberEntity):
         self._key = key
         self._register = register
         self._attr_translation_key = key
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_{key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
         self._attr_device_info = coordinator.device_info
         self._attr_native_unit_of_measurement = unit
         self._attr_native_min_value = min_val
@@ -9,7 +9,6 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MaicoCoordinator
-from .const import DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -63,12 +62,12 @@ ROOM_TEMP_SEL_TO_VALUE = {
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B select platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
     async_add_entities(
         [
@@ -89,9 +88,7 @@ class MaicoOperationModeSelect(CoordinatorEntity[MaicoCoordinator], SelectEntity
         """Initialize the select entity."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = (
-            f"{self._api.host}_{self._api.port}_operation_mode_select"
-        )
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_operation_mode_select"
         self._attr_device_info = coordinator.device_info
         self._attr_options = OPERATION_MODES
         self._attr_icon = "mdi:cog"
@@ -126,7 +123,7 @@ class MaicoSeasonSelect(CoordinatorEntity[MaicoCoordinator], SelectEntity):
         """Initialize the select entity."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_season_select"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_season_select"
         self._attr_device_info = coordinator.device_info
         self._attr_options = SEASON_MODES
         self._attr_icon = "mdi:weather-sunny-off"
@@ -162,7 +159,7 @@ class MaicoRoomTempSelectionSelect(CoordinatorEntity[MaicoCoordinator], SelectEn
         super().__init__(coordinator)
         self._api = coordinator.api
         self._attr_unique_id = (
-            f"{self._api.host}_{self._api.port}_room_temp_selection_select"
+            f"{coordinator.unique_id_prefix}_room_temp_selection_select"
         )
         self._attr_device_info = coordinator.device_info
         self._attr_options = ROOM_TEMP_SELECTION_MODES
@@ -25,7 +25,7 @@ from .const import (
     ATTR_SUPPLY_AIR_HUMIDITY,
     ATTR_SUPPLY_AIR_TEMP,
     ATTR_SUPPLY_FAN_SPEED,
-    DOMAIN,
+    ATTR_TEMP_BEFORE_EWT,
 )
 
 if TYPE_CHECKING:
@@ -144,6 +144,14 @@ SENSOR_TYPES = [
         "attr_name": "inlet_air_temperature",
         "icon": "mdi:thermometer",
     },
+    {
+        "key": "temperature_before_ewt",
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "unit_of_measurement": UnitOfTemperature.CELSIUS,
+        "attr_name": ATTR_TEMP_BEFORE_EWT,
+        "icon": "mdi:thermometer",
+    },
     {
         "key": "exhaust_air_temperature",
         "device_class": SensorDeviceClass.TEMPERATURE,
@@ -345,12 +353,12 @@ SENSOR_TYPES = [
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B sensor platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
     sensors = [
         MaicoWS320BSensor(
@@ -387,7 +395,7 @@ class MaicoWS320BSensor(CoordinatorEntity[MaicoCoordinator], SensorEntity):
         super().__init__(coordinator)
         self._key = key
         self._attr_translation_key = key
-        self._attr_unique_id = f"{coordinator.api.host}_{coordinator.api.port}_{key}"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_{key}"
         self._attr_device_info = coordinator.device_info
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -10,7 +10,6 @@ from homeassistant.const import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import MaicoCoordinator
-from .const import DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -21,12 +20,12 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Maico WS320B switch platform."""
-    coordinator: MaicoCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: MaicoCoordinator = config_entry.runtime_data
 
     entities = [
         MaicoWS320BPowerSwitch(coordinator),
@@ -42,7 +41,7 @@ async def async_setup_entry(
         ]
     )
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class MaicoWS320BPowerSwitch(CoordinatorEntity[MaicoCoordinator], SwitchEntity):
@@ -55,7 +54,7 @@ class MaicoWS320BPowerSwitch(CoordinatorEntity[MaicoCoordinator], SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_power_switch"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_power_switch"
         self._attr_device_info = coordinator.device_info
         self._attr_icon = "mdi:power"
 
@@ -93,7 +92,7 @@ class MaicoWS320BFilterChangeSwitch(CoordinatorEntity[MaicoCoordinator], SwitchE
         self._filter_type = filter_type
         self._attr_translation_key = f"filter_change_{filter_type}"
         self._attr_unique_id = (
-            f"{self._api.host}_{self._api.port}_{filter_type}_filter_change"
+            f"{coordinator.unique_id_prefix}_{filter_type}_filter_change"
         )
         self._attr_device_info = coordinator.device_info
         self._attr_icon = "mdi:air-filter"
@@ -105,13 +104,7 @@ class MaicoWS320BFilterChangeSwitch(CoordinatorEntity[MaicoCoordinator], SwitchE
 
     async def async_turn_on(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Handle the switch press - mark the filter as changed."""
-        success = False
-        if self._filter_type == "device":
-            success = await self._api.reset_filter_device()
-        elif self._filter_type == "outdoor":
-            success = await self._api.reset_filter_outdoor()
-        elif self._filter_type == "room":
-            success = await self._api.reset_filter_room()
+        success = await self._api.reset(self._filter_type)
 
         if success:
             _LOGGER.info("Successfully marked %s filter as changed", self._filter_type)
@@ -136,7 +129,7 @@ class MaicoWS320BBoostSwitch(CoordinatorEntity[MaicoCoordinator], SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         self._api = coordinator.api
-        self._attr_unique_id = f"{self._api.host}_{self._api.port}_boost"
+        self._attr_unique_id = f"{coordinator.unique_id_prefix}_boost"
         self._attr_device_info = coordinator.device_info
         self._attr_icon = "mdi:fan-plus"
 
@@ -1,13 +1,20 @@
 """Tests for Maico WS init."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.maicows.const import CONF_SERIAL_NUMBER, DOMAIN
+from custom_components.maicows import MaicoCoordinator
+from custom_components.maicows.const import (
+    CONF_SERIAL_NUMBER,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
 
 # Temporary: Allow socket to see if it fixes the issue (meaning mock is bypassed)
 # or if it reveals where the connection goes.
@@ -37,15 +44,13 @@ async def test_setup_unload_and_reload_entry(hass: HomeAssistant, mock_maico_ws_
     assert config_entry.state is ConfigEntryState.LOADED
 
     # Verify coordinator and API are stored
-    assert DOMAIN in hass.data
-    assert config_entry.entry_id in hass.data[DOMAIN]
+    assert config_entry.runtime_data is not None
 
     # Unload the entry
     await hass.config_entries.async_unload(config_entry.entry_id)
     await hass.async_block_till_done()
 
     assert config_entry.state is ConfigEntryState.NOT_LOADED
-    assert config_entry.entry_id not in hass.data[DOMAIN]
 
 
 async def test_setup_entry_exception(hass: HomeAssistant, mock_maico_ws_client):
@@ -74,3 +79,67 @@ async def test_setup_entry_exception(hass: HomeAssistant, mock_maico_ws_client):
         await hass.async_block_till_done()
 
     assert config_entry.state is ConfigEntryState.SETUP_RETRY
+
+
+def _make_coordinator(hass: HomeAssistant, slave_id: int = 1) -> MaicoCoordinator:
+    """Create a coordinator around a mocked API."""
+    api = MagicMock()
+    api.host = "1.2.3.4"
+    api.slave_id = slave_id
+    api.read_all_registers_into = AsyncMock(return_value={"operation_mode": "off"})
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_HOST: "1.2.3.4"})
+    return MaicoCoordinator(hass, api, entry)
+
+
+def _slot_error(coordinator: MaicoCoordinator, now: float) -> float:
+    """Return how far the next scheduled poll lands from the unit's slot."""
+    next_poll = int(now) + coordinator.update_interval.total_seconds()
+    error = (next_poll - coordinator._poll_phase) % DEFAULT_SCAN_INTERVAL
+    return min(error, DEFAULT_SCAN_INTERVAL - error)
+
+
+async def test_poll_phase_keeps_units_apart(hass: HomeAssistant):
+    """Test units on one gateway keep distinct poll slots on every poll."""
+    with patch.object(hass.loop, "time", return_value=1000.0):
+        first = _make_coordinator(hass, slave_id=1)
+        eleventh = _make_coordinator(hass, slave_id=11)
+    assert first._poll_phase != eleventh._poll_phase
+
+    for coordinator in (first, eleventh):
+        assert _slot_error(coordinator, 1000.0) < 1e-6
+        for now in (1010.4, 1023.9, 1031.2):
+            with patch.object(hass.loop, "time", return_value=now):
+                coordinator._adapt_interval(changed=True)
+            interval = coordinator.update_interval.total_seconds()
+            assert abs(interval - DEFAULT_SCAN_INTERVAL) <= DEFAULT_SCAN_INTERVAL / 2
+            assert _slot_error(coordinator, now) < 1e-6
+
+
+async def _poll(coordinator: MaicoCoordinator, *, changed: bool) -> float:
+    """Run one poll and return the nominal interval it leaves behind."""
+    coordinator.api.status_changed = changed
+    await coordinator._async_update_data()
+    interval = coordinator._interval
+    delay = coordinator.update_interval.total_seconds()
+    assert abs(delay - interval) <= DEFAULT_SCAN_INTERVAL / 2
+    return interval
+
+
+async def test_interval_backs_off_while_idle(hass: HomeAssistant):
+    """Test the interval doubles every 4 quiet polls and resets on activity."""
+    coordinator = _make_coordinator(hass)
+
+    assert await _poll(coordinator, changed=True) == 10
+    intervals = [await _poll(coordinator, changed=False) for _ in range(20)]
+    assert intervals == [10] * 3 + [20] * 4 + [40] * 4 + [80] * 4 + [120] * 5
+
+    assert await _poll(coordinator, changed=True) == 10
+
+    for _ in range(4):
+        await _poll(coordinator, changed=False)
+    assert coordinator._interval == 20
+
+    coordinator.api.read_all_registers_into.return_value = None
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator._interval == 10
@@ -1,11 +1,21 @@
 """Tests for the Maico WS API."""
 
+import asyncio
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException
 
-from custom_components.maicows.maico_ws_api import MaicoWS
+from custom_components.maicows.maico_ws.client import (
+    READ_CACHE_MAX_AGE,
+    from_temp,
+    merge_register_spans,
+    to_temp,
+)
+from custom_components.maicows.maico_ws.registers import MaicoWSRegisters
+from custom_components.maicows.maico_ws.status import READ_PLAN, _plan_reads
+from custom_components.maicows.maico_ws_api import MaicoWS, MaicoWSClient
 
 
 @pytest.fixture
@@ -27,6 +37,7 @@ def mock_modbus_client():
             return mock
 
         client.write_register.side_effect = mock_write_register
+        client.write_registers.side_effect = mock_write_register
 
         async def mock_read_holding_registers(address, count, device_id):
             mock = MagicMock()
@@ -39,6 +50,18 @@ def mock_modbus_client():
         yield client
 
 
+def test_mixins_use_client_io_methods():
+    """Test the mixins do not shadow the client's Modbus I/O methods."""
+    for name in (
+        "read_holding_register",
+        "read_holding_registers",
+        "read_register_map",
+        "read_blocks",
+        "write_registers",
+    ):
+        assert getattr(MaicoWS, name) is getattr(MaicoWSClient, name)
+
+
 async def test_connect_success(mock_modbus_client):
     """Test successful connection."""
     api = MaicoWS("localhost", 502)
@@ -57,6 +80,7 @@ async def test_connect_failure(mock_modbus_client):
     api = MaicoWS("localhost", 502)
     assert await api.connect() is False
     assert api.connected is False
+    assert api.last_error is not None
 
 
 async def test_read_all_registers_success(mock_modbus_client):
@@ -72,6 +96,207 @@ async def test_read_all_registers_success(mock_modbus_client):
     assert isinstance(data, dict)
 
 
+async def test_read_all_registers_one_request_per_group(mock_modbus_client):
+    """Test status polling issues one Modbus request per read group."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    await api.get_all_status()
+    assert mock_modbus_client.read_holding_registers.call_count == len(READ_PLAN)
+
+
+async def test_concurrent_status_polls_share_one_read(mock_modbus_client):
+    """Test concurrent status callers share a single in-flight poll."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    first, second = await asyncio.gather(api.get_all_status(), api.get_all_status())
+    assert first == second
+    assert mock_modbus_client.read_holding_registers.call_count == len(READ_PLAN)
+
+
+async def test_slow_groups_read_every_nth_poll(mock_modbus_client):
+    """Test slow groups are served from cache between scans."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    await api.get_all_status()
+    mock_modbus_client.read_holding_registers.reset_mock()
+
+    data = await api.get_all_status()
+    fast_groups = [group for group in READ_PLAN if group.scan_divider == 1]
+    assert mock_modbus_client.read_holding_registers.call_count == len(fast_groups)
+    assert "hours_total" in data
+
+
+async def test_write_invalidates_slow_group(mock_modbus_client):
+    """Test a write forces its slow group to be read on the next poll."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    await api.get_all_status()
+    assert await api.set_filter_device_months(6) is True
+    mock_modbus_client.read_holding_registers.reset_mock()
+
+    await api.get_all_status()
+    addresses = [
+        call.kwargs["address"]
+        for call in mock_modbus_client.read_holding_registers.call_args_list
+    ]
+    assert MaicoWSRegisters.FILTER_DEVICE_MONTHS in addresses
+
+
+async def test_single_failed_group_read_keeps_last_values(mock_modbus_client):
+    """Test one failed group read keeps its fields and a second drops them."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    data = await api.get_all_status()
+    assert "room_temperature" in data
+
+    async def fail_temperatures(address, count, device_id):
+        response = MagicMock()
+        response.isError.return_value = address == MaicoWSRegisters.ROOM_TEMP
+        response.registers = [0] * count
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = fail_temperatures
+
+    data = await api.get_all_status()
+    assert "room_temperature" in data
+    data = await api.get_all_status()
+    assert "room_temperature" not in data
+
+
+async def test_status_poll_fails_when_device_unreachable(mock_modbus_client):
+    """Test a poll with every read failing reports no data at all."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+    assert await api.get_all_status()
+
+    mock_modbus_client.read_holding_registers.side_effect = ConnectionException(
+        "Test Error"
+    )
+    assert await api.get_all_status() is None
+
+    mock_modbus_client.connected = False
+    assert await api.get_all_status() is None
+
+
+async def test_power_state_left_out_without_operation_mode(mock_modbus_client):
+    """Test power state is not guessed when the mode group is missing."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    async def fail_mode_group(address, count, device_id):
+        response = MagicMock()
+        response.isError.return_value = address == MaicoWSRegisters.OPERATION_MODE
+        response.registers = [0] * count
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = fail_mode_group
+
+    data = await api.get_all_status()
+    assert "operation_mode" not in data
+    assert "power_state" not in data
+
+
+async def test_status_changed_only_on_new_values(mock_modbus_client):
+    """Test unchanged register blocks are reported as clean."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    status: dict = {}
+    await api.read_all_registers_into(status)
+    assert api.status_changed is True
+
+    assert await api.read_all_registers_into(status) is status
+    assert api.status_changed is False
+
+
+async def test_get_all_status_keeps_buffer_change_tracking(mock_modbus_client):
+    """Test a direct status read does not hide changes from a buffer reader."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+    room_temp = 215
+
+    async def read_registers(address, count, device_id):
+        response = MagicMock()
+        response.isError.return_value = False
+        response.registers = [0] * count
+        if address == MaicoWSRegisters.ROOM_TEMP:
+            response.registers[0] = room_temp
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = read_registers
+
+    status: dict = {}
+    await api.read_all_registers_into(status)
+    assert status["room_temperature"] == 21.5
+
+    room_temp = 230
+    assert (await api.get_all_status())["room_temperature"] == 23.0
+
+    await api.read_all_registers_into(status)
+    assert status["room_temperature"] == 23.0
+    assert api.status_changed is True
+
+
+def test_merge_register_spans():
+    """Test ad-hoc register reads are merged into block spans."""
+    assert merge_register_spans([402, 401, 700, 703, 709]) == [
+        (401, 2),
+        (700, 4),
+        (709, 1),
+    ]
+    assert merge_register_spans(range(130), max_gap=0) == [(0, 125), (125, 5)]
+
+
+async def test_read_error_code_single_request(mock_modbus_client):
+    """Test the error code words are fetched with one block read."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    assert await api.read_error_code() == 0
+    assert mock_modbus_client.read_holding_registers.call_count == 1
+
+
+async def test_read_filter_status_single_request(mock_modbus_client):
+    """Test the three filter counters are read in one request."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    status = await api.read_filter_status()
+    assert status == {
+        "filter_device_days": 0,
+        "filter_outdoor_days": 0,
+        "filter_room_days": 0,
+    }
+    mock_modbus_client.read_holding_registers.assert_called_once_with(
+        address=655, count=3, device_id=1
+    )
+
+
+def test_from_temp_round_trips_negative_values():
+    """Test temperatures convert to 16-bit words and back."""
+    assert from_temp(2.3) == 23
+    assert from_temp(-3.0) == 0xFFE2
+    for tenths in range(-300, 501):
+        assert to_temp(from_temp(tenths / 10)) == tenths / 10
+
+
+def test_plan_reads_bridges_gaps():
+    """Test neighbouring fields are merged up to the allowed gap."""
+    register_map = (("a", 3, 100, 1), ("b", 3, 101, 2), ("c", 3, 105, 1))
+
+    groups, fields = _plan_reads(register_map, max_gap=0)
+    assert [(g.start, g.count) for g in groups] == [(100, 3), (105, 1)]
+
+    groups, fields = _plan_reads(register_map, max_gap=2)
+    assert [(g.start, g.count) for g in groups] == [(100, 6)]
+    assert fields["c"] == (0, 5, 1)
+
+
 async def test_write_ventilation_level(mock_modbus_client):
     """Test writing ventilation level."""
     api = MaicoWS("localhost", 502)
@@ -91,6 +316,112 @@ async def test_write_ventilation_level_invalid(mock_modbus_client):
     mock_modbus_client.write_register.assert_not_called()
 
 
+async def test_target_room_temperature_half_steps(mock_modbus_client):
+    """Test target temperatures are written in 0.5°C steps as °C * 10."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    for step in range(141):
+        temp = 18.0 + step * 0.05
+        assert await api.set_target_room_temperature(temp) is True
+        raw = mock_modbus_client.write_register.call_args.kwargs["value"]
+        assert raw == int(round(temp * 2) / 2 * 10)
+        assert raw % 5 == 0
+
+
+async def test_write_skipped_when_polled_value_matches(mock_modbus_client):
+    """Test a setter does not write a value the device just reported."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+    api.clear_read_cache()
+    await api.get_all_status()
+
+    assert await api.set_season(0) is True
+    mock_modbus_client.write_register.assert_not_called()
+
+    assert await api.set_season(1) is True
+    mock_modbus_client.write_register.assert_called_once()
+
+
+async def test_bus_sensor_feed_always_written(mock_modbus_client):
+    """Test bus sensor values are resent even when the device reports them."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+    api.clear_read_cache()
+    await api.get_all_status()
+
+    assert await api.write_bus_humidity(0) is True
+    assert await api.write_bus_humidity(0) is True
+    assert mock_modbus_client.write_register.call_count == 2
+
+
+async def test_write_register_map_one_request_per_run(mock_modbus_client):
+    """Test consecutive registers are written together, gaps are not filled."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    assert await api.write_register_map({302: 240, 301: 12, 553: 215}) is True
+    assert [
+        (call.kwargs["address"], call.kwargs["values"])
+        for call in mock_modbus_client.write_registers.call_args_list
+    ] == [(301, [12, 240]), (553, [215])]
+
+
+async def test_reset_all_filters_single_request(mock_modbus_client):
+    """Test the three filter indicators are reset with one FC16 request."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    assert await api.reset_all_filters() is True
+    mock_modbus_client.write_registers.assert_called_once_with(
+        address=MaicoWSRegisters.FILTER_CHANGE_DEVICE, values=[1, 1, 1], device_id=1
+    )
+    mock_modbus_client.write_register.assert_not_called()
+
+
+async def test_rtu_multi_register_writes_use_fc06():
+    """Test RTU writes of several registers go out one FC06 request each."""
+    with patch(
+        "custom_components.maicows.maico_ws.client.AsyncModbusSerialClient"
+    ) as mock_client:
+        client = mock_client.return_value
+
+        async def mock_connect():
+            return True
+
+        async def mock_write_register(*args, **kwargs):
+            mock = MagicMock()
+            mock.isError.return_value = False
+            return mock
+
+        client.connect.side_effect = mock_connect
+        client.write_register.side_effect = mock_write_register
+
+        api = MaicoWS(serial_port="/dev/ttyUSB0")
+        await api.connect()
+
+        assert await api.reset_all_filters() is True
+        assert (
+            await api.set_datetime(datetime(2026, 10, 15, 8, 30, 5, tzinfo=UTC)) is True
+        )
+
+    assert [
+        (call.kwargs["address"], call.kwargs["value"])
+        for call in client.write_register.call_args_list
+    ] == [
+        (MaicoWSRegisters.FILTER_CHANGE_DEVICE, 1),
+        (MaicoWSRegisters.FILTER_CHANGE_DEVICE + 1, 1),
+        (MaicoWSRegisters.FILTER_CHANGE_DEVICE + 2, 1),
+        (MaicoWSRegisters.DATE_YEAR, 2026),
+        (MaicoWSRegisters.DATE_YEAR + 1, 10),
+        (MaicoWSRegisters.DATE_YEAR + 2, 15),
+        (MaicoWSRegisters.DATE_YEAR + 3, 8),
+        (MaicoWSRegisters.DATE_YEAR + 4, 30),
+        (MaicoWSRegisters.DATE_YEAR + 5, 5),
+    ]
+    client.write_registers.assert_not_called()
+
+
 async def test_modbus_exception_handling(mock_modbus_client):
     """Test handling of Modbus exceptions."""
     api = MaicoWS("localhost", 502)
@@ -102,3 +433,67 @@ async def test_modbus_exception_handling(mock_modbus_client):
 
     result = await api.read_holding_registers(100, 1)
     assert result is None
+
+
+async def test_no_request_while_link_reconnects(mock_modbus_client):
+    """Test requests are skipped while pymodbus re-establishes the link."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    mock_modbus_client.connected = False
+    assert await api.read_holding_registers(100, 1) is None
+    assert await api.write_register(550, 1) is False
+    mock_modbus_client.read_holding_registers.assert_not_called()
+    mock_modbus_client.write_register.assert_not_called()
+
+
+async def test_single_register_reads_cached_until_write(mock_modbus_client):
+    """Test single register reads are memoized until written or cleared."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    await api.read_operation_mode()
+    await api.read_operation_mode()
+    assert mock_modbus_client.read_holding_registers.call_count == 1
+
+    assert await api.set_operation_mode(1) is True
+    await api.read_operation_mode()
+    assert mock_modbus_client.read_holding_registers.call_count == 2
+
+    api.clear_read_cache()
+    await api.read_operation_mode()
+    assert mock_modbus_client.read_holding_registers.call_count == 3
+
+
+async def test_single_register_cache_expires(mock_modbus_client):
+    """Test cached reads are not served past READ_CACHE_MAX_AGE."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+    readings = iter((215, 230))
+
+    async def read_temperature(address, count, device_id):
+        response = MagicMock()
+        response.isError.return_value = False
+        response.registers = [next(readings)]
+        return response
+
+    mock_modbus_client.read_holding_registers.side_effect = read_temperature
+
+    assert await api.read_room_temperature() == 21.5
+    assert await api.read_room_temperature() == 21.5
+    api._read_cache_time -= READ_CACHE_MAX_AGE + 1
+    assert await api.read_room_temperature() == 23.0
+
+
+async def test_status_poll_fills_read_cache(mock_modbus_client):
+    """Test single register reads after a status poll reuse its blocks."""
+    api = MaicoWS("localhost", 502)
+    await api.connect()
+
+    await api.get_all_status()
+    assert mock_modbus_client.read_holding_registers.call_count == len(READ_PLAN)
+
+    await api.read_room_temperature()
+    await api.read_operation_mode()
+    await api.read_error_code()
+    assert mock_modbus_client.read_holding_registers.call_count == len(READ_PLAN)